@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import functools
 import json
 import pathlib
+import re
 import shutil
 import typing as t
 
@@ -10,7 +12,7 @@ Bundle = t.Dict[str, t.Any]
 
 ASK_SIGNAL = "ASK"
 STOP_SIGNAL = "STOP"
-CLI_GATES = {"ruff", "mypy", "pytest"}
+CLI_GATES = frozenset({"ruff", "mypy", "pytest"})
 __all__ = [
     "load_bundle",
     "preflight",
@@ -23,24 +25,30 @@ __all__ = [
 
 def load_bundle(path: str | pathlib.Path) -> Bundle:
     p = pathlib.Path(path)
-    data = json.loads(p.read_text(encoding="utf-8"))
+    data = json.loads(p.read_bytes())
     return t.cast(Bundle, data)
 
 
+@functools.lru_cache(maxsize=32)
+def _tool_present(name: str, venv_bin: str) -> bool:
+    # Tool availability is static for the process; call cache_clear() to re-probe
+    return shutil.which(name) is not None or pathlib.Path(venv_bin, name).exists()
+
+
 def preflight(bundle: Bundle) -> list[str]:
     """Check presence of CLI validators declared in the bundle (skip logical gates).
 
     Deterministic and side-effect-free: raises ValueError with actionable hints.
-    Returns the list of checked tools on success.
+    Returns the sorted list of checked tools on success.
     """
-    gates = list(bundle.get("layers", {}).get("L2", {}).get("gates", []))
-    cli = [g for g in gates if g in CLI_GATES]
+    gates = bundle.get("layers", {}).get("L2", {}).get("gates", [])
+    # Sorted for a deterministic return value and error message
+    cli = sorted(CLI_GATES.intersection(gates))
     missing: list[str] = []
     root = pathlib.Path(__file__).resolve().parents[1]
-    venv_bin = root / ".venv" / "bin"
+    venv_bin = str(root / ".venv" / "bin")
     for tool in cli:
-        present = shutil.which(tool) is not None or (venv_bin / tool).exists()
-        if not present:
+        if not _tool_present(tool, venv_bin):
             missing.append(tool)
     if missing:
         raise ValueError(f"Missing validators: {', '.join(missing)}. Install dev tools and retry.")
@@ -53,11 +61,20 @@ def mask_io(bundle: Bundle, *, requires_db: bool = False) -> None:
         raise ValueError("DB access is not permitted in this context")
 
 
+@functools.lru_cache(maxsize=64)
+def _compile_patterns(patterns: tuple[str, ...]) -> re.Pattern[str] | None:
+    # One alternation scans the event once instead of one substring search per pattern
+    if not patterns:
+        return None
+    return re.compile("|".join(map(re.escape, patterns)))
+
+
 def should_ask_stop(bundle: Bundle, event: str) -> str | None:
-    ask = bundle.get("ask_stop", {}).get("ask_if", [])
-    stop = bundle.get("ask_stop", {}).get("stop_if", [])
-    if any(k in event for k in stop):
+    ask_stop = bundle.get("ask_stop", {})
+    stop_re = _compile_patterns(tuple(ask_stop.get("stop_if", [])))
+    if stop_re is not None and stop_re.search(event):
         return STOP_SIGNAL
-    if any(k in event for k in ask):
+    ask_re = _compile_patterns(tuple(ask_stop.get("ask_if", [])))
+    if ask_re is not None and ask_re.search(event):
         return ASK_SIGNAL
     return None
@@ -1,15 +1,36 @@
 #!/usr/bin/env python3
-# stdlib-only; requires GitHub CLI installed and authenticated (gh auth status)
+# stdlib-only (orjson used if present); requires GitHub CLI installed and authenticated (gh auth status)
+# With a token ($GITHUB_TOKEN/$GH_TOKEN or `gh auth token`), API calls go straight to the REST API.
 import argparse
+import http.client
 import json
+import os
 import re
+import ssl
 import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import Any
+
+# Optional C encoder; OPT_INDENT_2|OPT_SORT_KEYS output is byte-identical to the
+# stdlib fallback below (indent=2, sort_keys=True, ensure_ascii=False).
+orjson: Any = None
+try:
+    import orjson as _orjson  # type: ignore
+    orjson = _orjson
+except ImportError:  # stdlib-only environments
+    orjson = None
 
 ROOT = Path(__file__).resolve().parents[2]
 OUT_DIR_DEFAULT = ROOT / "docs/codex/reviews"
+CACHE_DIR_DEFAULT = ROOT / ".cache/gh"
+MAX_FETCH_WORKERS = 8  # gh calls are network-bound; overlap a few PRs at a time
+AGG_BUFFER_SIZE = 1 << 20  # aggregate NDJSON is written in large binary chunks
+API_HOST = "api.github.com"
+NEXT_LINK_RE = re.compile(r'<https://api\.github\.com(/[^>]+)>;\s*rel="next"')
 
 
 def sh(*args, capture=True, text=True):
@@ -37,18 +58,153 @@ def repo_slug():
     return m.group(1)
 
 
+def dump_pretty(obj):
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, ensure_ascii=False, indent=2, sort_keys=True) + "\n").encode("utf-8")
+
+
+def shown_path(resolved):
+    # Repo-relative when under ROOT; pure path arithmetic, no filesystem calls
+    try:
+        return resolved.relative_to(ROOT)
+    except ValueError:
+        return resolved
+
+
+class RestClient:
+    """Token-authenticated GitHub REST GETs over one keep-alive HTTPS connection per thread.
+
+    Replaces a fork+exec of `gh` (config load, token lookup, TLS handshake) per call.
+    """
+
+    def __init__(self, token, slug):
+        self.token = token
+        self.slug = slug
+        self.ctx = ssl.create_default_context()
+        self.local = threading.local()
+
+    def _request(self, path, accept):
+        conn = getattr(self.local, "conn", None)
+        if conn is None:
+            conn = self.local.conn = http.client.HTTPSConnection(API_HOST, context=self.ctx, timeout=30)
+        headers = {
+            "Accept": accept,
+            "Authorization": f"Bearer {self.token}",
+            "User-Agent": "lexlattice-export-pr-feedback",
+            "X-GitHub-Api-Version": "2022-11-28",
+        }
+        try:
+            conn.request("GET", path, headers=headers)
+            resp = conn.getresponse()
+            body = resp.read()
+        except (http.client.HTTPException, OSError):
+            conn.close()
+            self.local.conn = None
+            raise
+        if resp.status != 200:
+            raise RuntimeError(f"GET {path}: HTTP {resp.status}")
+        m = NEXT_LINK_RE.search(resp.getheader("Link") or "")
+        return json.loads(body), (m.group(1) if m else None)
+
+    def _get_page(self, path, accept):
+        # Retry once: the server may have dropped the idle keep-alive connection
+        try:
+            return self._request(path, accept)
+        except (http.client.HTTPException, OSError):
+            return self._request(path, accept)
+
+    def get(self, path, accept="application/vnd.github+json"):
+        """GET a `gh api`-style path (:owner/:repo placeholders allowed); returns the JSON body."""
+        return self._get_page("/" + path.replace(":owner/:repo", self.slug), accept)[0]
+
+    def get_all(self, path, accept="application/vnd.github+json"):
+        """GET every page of a list endpoint (like `gh api --paginate`) and concatenate."""
+        path = "/" + path.replace(":owner/:repo", self.slug)
+        items, nxt = self._get_page(path + ("&" if "?" in path else "?") + "per_page=100", accept)
+        while nxt:
+            page, nxt = self._get_page(nxt, accept)
+            items.extend(page)
+        return items
+
+
+REST = None  # set by main() when a token is available; otherwise calls go through `gh`
+
+
 def gh_api(path, accept="application/vnd.github+json"):
+    """GET every page of `path`; returns (items, ok), ok False (items []) when the call failed."""
+    if REST is not None:
+        try:
+            return REST.get_all(path, accept), True
+        except (RuntimeError, ValueError, http.client.HTTPException, OSError):
+            return [], False
     # Uses :owner/:repo notation so `gh` injects current repo automatically.
-    out = try_sh("gh", "api", "-H", f"Accept: {accept}", "--paginate", path)
-    return json.loads(out or "[]")
+    try:
+        out = sh("gh", "api", "-H", f"Accept: {accept}", "--paginate", path)
+        return json.loads(out or "[]"), True
+    except (subprocess.CalledProcessError, ValueError):
+        return [], False
 
 
 def gh_pr_view(pr):
+    if REST is not None:
+        p = REST.get(f"repos/:owner/:repo/pulls/{pr}")
+        # Same shape as `gh pr view --json ...`
+        return {
+            "title": p.get("title"),
+            "number": p.get("number"),
+            "author": {"login": (p.get("user") or {}).get("login")},
+            "url": p.get("html_url"),
+            "createdAt": p.get("created_at"),
+            "updatedAt": p.get("updated_at"),
+            "headRefName": (p.get("head") or {}).get("ref"),
+            "baseRefName": (p.get("base") or {}).get("ref"),
+        }
     fields = "title,number,author,url,createdAt,updatedAt,headRefName,baseRefName"
     out = sh("gh", "pr", "view", str(pr), "--json", fields)
     return json.loads(out)
 
 
+def fetch_pr(pr, cache_dir=None):
+    """Return (meta, reviews, review_comments, issue_comments) for a PR.
+
+    With a cache_dir, the PR's `updatedAt` decides whether the cached copy
+    (PR-<n>.json) is still current; GitHub bumps updatedAt on new reviews/comments.
+    The PR view is fetched once: it is both the freshness probe and the meta.
+    """
+    meta = gh_pr_view(pr)
+    cache_path = cache_dir / f"PR-{pr}.json" if cache_dir is not None else None
+    if cache_path is not None and cache_path.exists():
+        updated = meta.get("updatedAt")
+        try:
+            cached = json.loads(cache_path.read_bytes())
+        except (OSError, ValueError):
+            cached = None
+        if updated and isinstance(cached, dict) and cached.get("updatedAt") == updated:
+            return meta, cached["reviews"], cached["review_comments"], cached["issue_comments"]
+
+    reviews, ok_reviews = gh_api(f"repos/:owner/:repo/pulls/{pr}/reviews")
+    rev_comments, ok_rev_comments = gh_api(f"repos/:owner/:repo/pulls/{pr}/comments")
+    issue_comments, ok_issue_comments = gh_api(f"repos/:owner/:repo/issues/{pr}/comments")
+    if cache_path is not None and not (ok_reviews and ok_rev_comments and ok_issue_comments):
+        # Never cache a partial fetch: it would be served until the PR's updatedAt moves
+        print(f"[warn] PR {pr}: fetch incomplete; not caching", file=sys.stderr)
+    elif cache_path is not None:
+        record = {
+            "updatedAt": meta.get("updatedAt"),
+            "meta": meta,
+            "reviews": reviews,
+            "review_comments": rev_comments,
+            "issue_comments": issue_comments,
+        }
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_bytes(json.dumps(record, ensure_ascii=False).encode("utf-8"))
+        except OSError as e:
+            print(f"[warn] PR {pr}: cache write failed: {e}", file=sys.stderr)
+    return meta, reviews, rev_comments, issue_comments
+
+
 def normalize_review(r):
     return {
         "type": "review",
@@ -105,72 +261,77 @@ def main():
     ap.add_argument("prs", nargs="+", type=int, help="PR numbers (e.g., 12 34 56)")
     ap.add_argument("--out-dir", default=str(OUT_DIR_DEFAULT), help="Output directory for per-PR JSON files")
     ap.add_argument("--aggregate", default="", help="Optional path to write an aggregate NDJSON")
+    ap.add_argument("--cache-dir", default=str(CACHE_DIR_DEFAULT), help="Cache of raw gh responses keyed by PR updatedAt")
+    ap.add_argument("--no-cache", action="store_true", help="Always refetch from GitHub; do not read or write the cache")
     args = ap.parse_args()
 
+    global REST
     slug = repo_slug()
+    token = os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN") or try_sh("gh", "auth", "token")
+    if token:
+        REST = RestClient(token, slug)
     out_dir = Path(args.out_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
+    out_dir_shown = shown_path(out_dir.resolve())
+    cache_dir = None if args.no_cache else Path(args.cache_dir) / slug
 
-    agg_fp = None
+    agg_f = None
     if args.aggregate:
-        agg_fp = Path(args.aggregate)
+        agg_fp = Path(args.aggregate).resolve()
         agg_fp.parent.mkdir(parents=True, exist_ok=True)
-        agg_f = agg_fp.open("w", encoding="utf-8")
+        agg_f = agg_fp.open("wb", buffering=AGG_BUFFER_SIZE)
 
-    for pr in args.prs:
-        try:
-            meta = gh_pr_view(pr)
-            reviews = gh_api(f"repos/:owner/:repo/pulls/{pr}/reviews")
-            rev_comments = gh_api(f"repos/:owner/:repo/pulls/{pr}/comments")
-            issue_comments = gh_api(f"repos/:owner/:repo/issues/{pr}/comments")
-        except Exception as e:
-            print(f"[warn] PR {pr}: fetch failed: {e}", file=sys.stderr)
-            continue
-
-        entries = (
-            [normalize_review(r) for r in reviews]
-            + [normalize_review_comment(c) for c in rev_comments]
-            + [normalize_issue_comment(c) for c in issue_comments]
-        )
-        entries.sort(key=ts)
-
-        data = {
-            "repo": slug,
-            "pr": pr,
-            "meta": {
-                "title": meta.get("title"),
-                "number": meta.get("number"),
-                "author": (meta.get("author") or {}).get("login"),
-                "url": meta.get("url"),
-                "createdAt": meta.get("createdAt"),
-                "updatedAt": meta.get("updatedAt"),
-                "head": meta.get("headRefName"),
-                "base": meta.get("baseRefName"),
-                "exportedAt": datetime.now(UTC).isoformat(timespec="seconds"),
-            },
-            "entries": entries,
-        }
+    # Fetch concurrently, but consume results in argument order so files and
+    # aggregate rows are written single-threaded and deterministically.
+    with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(args.prs))) as ex:
+        futures = [(pr, ex.submit(fetch_pr, pr, cache_dir)) for pr in args.prs]
+        for pr, fut in futures:
+            try:
+                meta, reviews, rev_comments, issue_comments = fut.result()
+            except Exception as e:
+                print(f"[warn] PR {pr}: fetch failed: {e}", file=sys.stderr)
+                continue
 
-        out_path = out_dir / f"PR-{pr}.json"
-        out_path.write_text(json.dumps(data, ensure_ascii=False, indent=2, sort_keys=True) + "\n", encoding="utf-8")
-        try:
-            rel_path = out_path.resolve().relative_to(ROOT)
-            print(f"Wrote {rel_path}")
-        except Exception:
-            print(f"Wrote {out_path}")
+            entries = (
+                [normalize_review(r) for r in reviews]
+                + [normalize_review_comment(c) for c in rev_comments]
+                + [normalize_issue_comment(c) for c in issue_comments]
+            )
+            entries.sort(key=ts)
+
+            data = {
+                "repo": slug,
+                "pr": pr,
+                "meta": {
+                    "title": meta.get("title"),
+                    "number": meta.get("number"),
+                    "author": (meta.get("author") or {}).get("login"),
+                    "url": meta.get("url"),
+                    "createdAt": meta.get("createdAt"),
+                    "updatedAt": meta.get("updatedAt"),
+                    "head": meta.get("headRefName"),
+                    "base": meta.get("baseRefName"),
+                    "exportedAt": datetime.now(UTC).isoformat(timespec="seconds"),
+                },
+                "entries": entries,
+            }
 
-        if agg_f:
-            for e in entries:
-                row = {"repo": slug, "pr": pr, **e}
-                agg_f.write(json.dumps(row, ensure_ascii=False, sort_keys=True) + "\n")
+            out_path = out_dir / f"PR-{pr}.json"
+            out_path.write_bytes(dump_pretty(data))
+            print(f"Wrote {out_dir_shown / out_path.name}")
+
+            if agg_f:
+                # Encode each row once and hand the whole PR to the writer in one call
+                rows = bytearray()
+                for entry in entries:
+                    row = {"repo": slug, "pr": pr, **entry}
+                    rows += json.dumps(row, ensure_ascii=False, sort_keys=True).encode("utf-8")
+                    rows += b"\n"
+                agg_f.write(rows)
 
     if agg_f:
-        agg_f.flush()
-        try:
-            agg_f_path = Path(agg_f.name).resolve().relative_to(ROOT)
-            print(f"Wrote {agg_f_path}")
-        except Exception:
-            print(f"Wrote {agg_f.name}")
+        agg_f.close()
+        print(f"Wrote {shown_path(agg_fp)}")
 
 
 if __name__ == "__main__":
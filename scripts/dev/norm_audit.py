@@ -16,20 +16,38 @@ Notes:
 from __future__ import annotations
 
 import argparse
+import functools
 import hashlib
 import json
 import os
 import re
 import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Tuple
 
 ROOT = Path(__file__).resolve().parents[2]
 NORMSET_PATH = ROOT / "docs" / "norms" / "NormSet.base.yaml"
 REPORTS_DIR = ROOT / "docs" / "codex" / "reports"
 CODEX_JOURNAL = ROOT / "scripts" / "dev" / "codex_journal.py"
 
+# Directory names never descended into for L1 violations (compared case-insensitively)
+EXCLUDED_DIRS = frozenset({".venv", "venv", "build", "dist", ".git", "__pycache__", "node_modules"})
+# One pass over raw bytes finds both broad-except forms (no decode needed)
+BROAD_EXCEPT_RE = re.compile(rb"\bexcept\s+(Exception|BaseException)\b")
+# L2 validators, reported in this order; read-only ones run concurrently
+VALIDATORS: Dict[str, List[str]] = {
+    "ruff": ["ruff", "check"],
+    "mypy": ["mypy"],
+    "pytest": ["pytest", "-q"],
+}
+# These write into the working tree (pytest applies diffs, rewrites waivers), so they
+# run only after the concurrent read-only validators have finished
+TREE_WRITING_VALIDATORS = frozenset({"pytest"})
+# Below this many files, process-pool spawn costs more than the scan itself
+PARALLEL_SCAN_MIN_FILES = 256
+
 
 def sh(cmd: List[str]) -> Tuple[int, str, str]:
     try:
@@ -53,9 +71,9 @@ def read_normset_id(path: Path) -> str:
     return m.group(1).strip() if m else "NormSet.base.v1"
 
 
-def docs_updated(pr_number: int, branch: str) -> bool:
-    """
-    Detect if README.md or docs/** changed vs base.
+@functools.lru_cache(maxsize=None)
+def _diff_basepoint(pr_number: int) -> str:
+    """Resolve (once per process) the commit to diff HEAD against.
     Strategy: try PR base via gh; else 'main'; else HEAD~1.
     """
     target = ""
@@ -67,41 +85,72 @@ def docs_updated(pr_number: int, branch: str) -> bool:
         elif err:
             print(f"Warning: gh pr view failed: {err}", file=sys.stderr)
     target = target or "main"
-    code, _, err = sh(["git", "fetch", "origin", target, "--depth=1"])
-    if code != 0 and err:
-        print(f"Warning: git fetch for '{target}' failed: {err}", file=sys.stderr)
+    # Only hit the network when the remote-tracking ref is not already present
+    code, _, _ = sh(["git", "rev-parse", "--verify", "--quiet", f"origin/{target}"])
+    if code != 0:
+        code, _, err = sh(["git", "fetch", "origin", target, "--depth=1"])
+        if code != 0 and err:
+            print(f"Warning: git fetch for '{target}' failed: {err}", file=sys.stderr)
     code, mb, _ = sh(["git", "merge-base", f"origin/{target}", "HEAD"])
     if code == 0 and mb:
-        basepoint = mb
-    elif target:
-        basepoint = f"origin/{target}"
-    else:
-        basepoint = "HEAD~1"
-    code, out, _ = sh(["git", "diff", "--name-only", basepoint, "HEAD"])
+        return mb
+    if target:
+        return f"origin/{target}"
+    return "HEAD~1"
+
+
+def docs_updated(pr_number: int, branch: str) -> bool:
+    """Detect if README.md or docs/** changed vs base."""
+    code, out, _ = sh(["git", "diff", "--name-only", "-z", _diff_basepoint(pr_number), "HEAD"])
     if code != 0 or not out:
         return False
-    files = [p.strip() for p in out.splitlines() if p.strip()]
-    return any(f == "README.md" or f.startswith("docs/") for f in files)
+    return any(f == "README.md" or f.startswith("docs/") for f in out.split("\0") if f)
+
+
+def _iter_py(root: Path) -> Iterator[str]:
+    """Yield .py file paths under root, pruning excluded dirs before descending."""
+    stack = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            continue  # unreadable or vanished directory: skip it, keep walking
+        subdirs: List[str] = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name.lower() not in EXCLUDED_DIRS:
+                    subdirs.append(entry.path)
+            elif entry.name.endswith(".py") and entry.is_file(follow_symlinks=False):
+                yield entry.path
+        # Reverse so the DFS pops subdirectories in name order
+        stack.extend(reversed(subdirs))
+
+
+def _scan_one(path: str) -> List[str]:
+    with open(path, "rb") as f:
+        data = f.read()
+    found = {m.group(1) for m in BROAD_EXCEPT_RE.finditer(data)}
+    # Fixed order keeps the report deterministic (one entry per kind per file)
+    return [f"{path}: except {kind.decode()}" for kind in (b"Exception", b"BaseException") if kind in found]
 
 
 def scan_violation_mix(root: Path) -> List[str]:
-    violations: List[str] = []
+    """L1 violations in path order; scan errors are reported in-band."""
+    out: List[str] = []
     try:
-        for p in root.rglob("*.py"):
-            parts = {seg.lower() for seg in p.parts}
-            if any(x in parts for x in (".venv", "venv", "build", "dist")):
-                continue
-            try:
-                txt = p.read_text(encoding="utf-8", errors="ignore")
-            except (OSError, UnicodeDecodeError):
-                raise
-            if re.search(r"\bexcept\s+Exception\b", txt):
-                violations.append(f"{p}: except Exception")
-            if re.search(r"\bexcept\s+BaseException\b", txt):
-                violations.append(f"{p}: except BaseException")
+        paths = list(_iter_py(root))
+        if len(paths) > PARALLEL_SCAN_MIN_FILES:
+            # ex.map preserves input order, so output stays deterministic
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+                for vs in ex.map(_scan_one, paths, chunksize=64):
+                    out.extend(vs)
+        else:
+            for p in paths:
+                out.extend(_scan_one(p))
     except (OSError, ValueError) as e:
-        violations.append(f"scan_error: {type(e).__name__}: {e}")
-    return violations
+        out.append(f"scan_error: {type(e).__name__}: {e}")
+    return out
 
 
 def run_validator(cmd: List[str]) -> bool:
@@ -109,20 +158,20 @@ def run_validator(cmd: List[str]) -> bool:
     return code == 0
 
 
-def determinism_score(gen, reruns: int) -> float:
-    """Measure stability of generation by re-running it."""
+def _payload_digest(payload) -> str:
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def determinism_score(gen, reruns: int, reference=None) -> float:
+    """Measure stability of generation by re-running it.
+
+    An already generated `reference` payload counts as the first run, so only
+    reruns-1 further generations (each running every validator) are needed.
+    """
     if reruns <= 1:
         return 1.0
-    first = None
-    stable = 0
-    for _ in range(reruns):
-        payload = gen()
-        digest = hashlib.sha256(json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
-        if first is None:
-            first = digest
-            stable += 1
-        else:
-            stable += int(digest == first)
+    first = _payload_digest(reference if reference is not None else gen())
+    stable = 1 + sum(_payload_digest(gen()) == first for _ in range(reruns - 1))
     return stable / reruns
 
 
@@ -156,15 +205,19 @@ def main() -> int:
 
     def generate_payload() -> Dict[str, object]:
         normset_id = read_normset_id(NORMSET_PATH)
+        concurrent = {name: cmd for name, cmd in VALIDATORS.items() if name not in TREE_WRITING_VALIDATORS}
+        with ThreadPoolExecutor(max_workers=len(concurrent)) as ex:
+            futures = {name: ex.submit(run_validator, cmd) for name, cmd in concurrent.items()}
+            # git/gh probing overlaps with the validator subprocesses
+            docs_ok = docs_updated(args.pr, args.branch)
+            done = {name: fut.result() for name, fut in futures.items()}
         v_results: Dict[str, bool] = {
-            "ruff": run_validator(["ruff", "check"]),
-            "mypy": run_validator(["mypy"]),
-            "pytest": run_validator(["pytest", "-q"]),
-            "docs_updated": docs_updated(args.pr, args.branch),
+            name: done[name] if name in done else run_validator(cmd) for name, cmd in VALIDATORS.items()
         }
+        v_results["docs_updated"] = docs_ok
         normpass_at_1 = sum(1 for v in v_results.values() if v) / max(len(v_results), 1)
         violations = scan_violation_mix(git_root())
-        l1_pass = len([v for v in violations if "scan_error" not in v]) == 0
+        l1_pass = not any("scan_error" not in v for v in violations)
         conformance = {
             "L0": "pass",
             "L1": [f"exceptions.narrow:{'pass' if l1_pass else 'fail'}"],
@@ -185,7 +238,7 @@ def main() -> int:
 
     payload = generate_payload()
     reruns = int(os.environ.get("NORM_AUDIT_RERUNS", "1"))
-    payload["metrics"]["DeterminismScore"] = determinism_score(generate_payload, reruns)  # type: ignore[index]
+    payload["metrics"]["DeterminismScore"] = determinism_score(generate_payload, reruns, reference=payload)  # type: ignore[index]
 
     summary_lines = [
         f"- NormSet: `{payload['normset']}`",
@@ -193,13 +246,15 @@ def main() -> int:
         f"- L1 Violations: {len(payload['metrics']['ViolationMix'])}",
         f"- Metrics: NormPass@1={payload['metrics']['NormPass@1']:.2f}, RepairDepth=0, DeterminismScore={payload['metrics']['DeterminismScore']:.2f}, WaiverCount=0",
     ]
-    md = "## Norm Audit\n" + "\n".join(summary_lines) + "\n\n```json\n" + json.dumps(payload, indent=2, sort_keys=True) + "\n```\n"
+    # Serialized once; the journal block and the sidecar share the same text
+    payload_json = json.dumps(payload, indent=2, sort_keys=True)
+    md = "## Norm Audit\n" + "\n".join(summary_lines) + "\n\n```json\n" + payload_json + "\n```\n"
 
     # Write JSON sidecar for dashboards (deterministic; narrow exceptions)
     try:
         side = REPORTS_DIR / f"PR-{args.pr}.json"
         REPORTS_DIR.mkdir(parents=True, exist_ok=True)
-        side.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+        side.write_text(payload_json, encoding="utf-8")
     except (OSError, TypeError, ValueError) as e:
         # Non-fatal: journaling continues via markdown fallback
         print(f"Warning: failed to write audit JSON sidecar: {type(e).__name__}: {e}", file=sys.stderr)
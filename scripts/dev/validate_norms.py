@@ -17,18 +17,22 @@ import re
 import sys
 from pathlib import Path
 
+# Single pass over raw bytes for both keys (optional leading spaces/inline comments).
+# Group 2 (lookahead) records whether a value follows the colon; `id:` requires one.
+TOP_KEYS_RE = re.compile(rb"(?m)^\s*(id|layers)\s*:(?=(\s*\S))?")
+
 
 def validate(path: Path) -> list[str]:
     errs: list[str] = []
     try:
-        txt = path.read_text(encoding="utf-8")
+        data = path.read_bytes()
     except (FileNotFoundError, OSError) as e:
         return [f"cannot read {path}: {type(e).__name__}: {e}"]
 
-    # Accept optional leading spaces and inline comments after the key
-    if not re.search(r"(?m)^\s*id\s*:\s*\S+", txt):
+    found = {m.group(1) for m in TOP_KEYS_RE.finditer(data) if m.group(1) == b"layers" or m.group(2)}
+    if b"id" not in found:
         errs.append("missing `id:`")
-    if not re.search(r"(?m)^\s*layers\s*:\s*", txt):
+    if b"layers" not in found:
         errs.append("missing `layers:` block")
     return errs
 
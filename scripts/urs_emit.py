@@ -15,19 +15,24 @@ import json
 import os
 import re
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 ROOT = Path(__file__).resolve().parents[1]
 COMPILED_RULEBOOK = ROOT / "docs" / "agents" / "Compiled.Rulebook.md"
 NORMSET_PATH = ROOT / "docs" / "norms" / "NormSet.base.yaml"
 
+NORMSET_ID_RE = re.compile(r"^id:\s*([^\s#]+)", re.MULTILINE)
+LAYER_HEADING_RE = re.compile(r"^##+\s*(L[01])\b")
+BULLET_RE = re.compile(r"^\s*[-*]\s+([`\w][^`]+)\s*$")
+CANONICAL = json.JSONEncoder(sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
 
 def read_normset_id(path: Path) -> str:
     try:
         txt = path.read_text(encoding="utf-8")
     except (OSError, UnicodeDecodeError):
         return "NormSet.base.v1"
-    m = re.search(r"^id:\s*([^\s#]+)", txt, flags=re.MULTILINE)
+    m = NORMSET_ID_RE.search(txt)
     return m.group(1).strip() if m else "NormSet.base.v1"
 
 
@@ -44,13 +49,11 @@ def parse_l0_l1_from_compiled_md(path: Path) -> Dict[str, List[str]]:
     l1: List[str] = []
     cur = None
     for line in txt.splitlines():
-        if re.match(r"^##+\s*L0\b", line):
-            cur = "L0"
-            continue
-        if re.match(r"^##+\s*L1\b", line):
-            cur = "L1"
+        h = LAYER_HEADING_RE.match(line)
+        if h:
+            cur = h.group(1)
             continue
-        m = re.match(r"^\s*[-*]\s+([`\w][^`]+)\s*$", line)
+        m = BULLET_RE.match(line)
         if m and cur in {"L0", "L1"}:
             name = m.group(1).strip().strip("` ")
             (l0 if cur == "L0" else l1).append(name)
@@ -62,7 +65,8 @@ def parse_l0_l1_from_compiled_md(path: Path) -> Dict[str, List[str]]:
     return {"L0": l0, "L1": l1}
 
 
-def build_bundle() -> Dict[str, Any]:
+def build_bundle_canonical() -> Tuple[Dict[str, Any], bytes]:
+    """Build the bundle and its canonical JSON bytes (fingerprint included)."""
     layers = parse_l0_l1_from_compiled_md(COMPILED_RULEBOOK)
     # L2 gates per DoD (norm_audit validators)
     l2 = {"gates": ["ruff", "mypy", "pytest", "docs_updated"]}
@@ -83,23 +87,52 @@ def build_bundle() -> Dict[str, Any]:
         },
         "waivers": [],
     }
-    # Fingerprint over canonical JSON
-    canonical = json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
-    obj["fingerprint"] = "sha256:" + hashlib.sha256(canonical).hexdigest()
-    return obj
+    members = _canonical_members(obj)
+    obj["fingerprint"] = "sha256:" + _hash_members(members)
+    # Only the new member is encoded; everything else is reused for the output
+    members.update(_canonical_members({"fingerprint": obj["fingerprint"]}))
+    return obj, b"{" + b",".join(members[k] for k in sorted(members)) + b"}"
+
+
+def _canonical_members(obj: Dict[str, Any]) -> Dict[str, bytes]:
+    """Encode each top-level member of obj once, as canonical `"key":value` bytes.
+
+    Joining them in sorted key order inside braces reproduces the canonical dump
+    of obj, so the same fragments serve both the fingerprint and the output file.
+    """
+    return {k: (CANONICAL.encode(k) + ":" + CANONICAL.encode(v)).encode("utf-8") for k, v in obj.items()}
+
+
+def _hash_members(members: Dict[str, bytes]) -> str:
+    # Fed piecewise: the canonical document is never materialized just to hash it
+    h = hashlib.sha256(b"{")
+    for i, k in enumerate(sorted(members)):
+        if i:
+            h.update(b",")
+        h.update(members[k])
+    h.update(b"}")
+    return h.hexdigest()
+
+
+def build_bundle() -> Dict[str, Any]:
+    return build_bundle_canonical()[0]
 
 
 def main() -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument("--format", choices=["json"], default="json")
     ap.add_argument("--out", required=True, help="output file path (json)")
+    ap.add_argument("--pretty", action="store_true", help="indent output for humans (default: canonical JSON)")
     args = ap.parse_args()
 
-    bundle = build_bundle()
+    bundle, canonical = build_bundle_canonical()
     out_path = Path(args.out)
     out_path.parent.mkdir(parents=True, exist_ok=True)
     try:
-        out_path.write_text(json.dumps(bundle, indent=2, sort_keys=True), encoding="utf-8")
+        if args.pretty:
+            out_path.write_bytes(json.dumps(bundle, indent=2, sort_keys=True).encode("utf-8"))
+        else:
+            out_path.write_bytes(canonical)
     except (OSError, UnicodeEncodeError, TypeError) as e:
         # Surface actionable message and non-zero exit deterministically
         print(f"Error writing bundle to {out_path}: {type(e).__name__}: {e}")
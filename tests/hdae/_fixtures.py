@@ -0,0 +1,76 @@
+# ruff: noqa: I001
+"""Shared test helpers: cached tests/fixtures contents (never mutated) and JSON I/O."""
+from __future__ import annotations
+
+import difflib
+import functools
+import json
+from pathlib import Path
+from typing import Any, FrozenSet, Iterable, Optional, Tuple
+
+orjson: Any = None
+try:  # optional fast JSON codec; stdlib json is the fallback
+    import orjson as _orjson
+
+    orjson = _orjson
+except ImportError:
+    orjson = None
+
+
+FIX_ROOT = Path(__file__).resolve().parents[1] / "fixtures"
+
+
+@functools.lru_cache(maxsize=None)
+def fixture_bytes(rel: str) -> bytes:
+    return (FIX_ROOT / rel).read_bytes()
+
+
+@functools.lru_cache(maxsize=None)
+def fixture_text(rel: str) -> str:
+    return fixture_bytes(rel).decode("utf-8")
+
+
+@functools.lru_cache(maxsize=None)
+def fixture_stripped(rel: str) -> str:
+    # Normalized form used by the patcher idempotency asserts
+    return fixture_text(rel).strip()
+
+
+@functools.lru_cache(maxsize=None)
+def fixture_lines(rel: str) -> Tuple[str, ...]:
+    return tuple(fixture_text(rel).splitlines(True))
+
+
+@functools.lru_cache(maxsize=64)
+def expected_diff(before_rel: str, after_rel: str, rel: str) -> str:
+    """Unified diff the CLI should print when patching `before` into `after` at `rel`."""
+    return "".join(
+        difflib.unified_diff(
+            fixture_lines(before_rel),
+            fixture_lines(after_rel),
+            fromfile=f"a/{rel}",
+            tofile=f"b/{rel}",
+        )
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def apply_all_cached(src: str, path: str, packs: Optional[FrozenSet[str]] = None) -> Tuple[str, Tuple[str, ...]]:
+    # apply_all is a pure function of its inputs, so each LibCST pass runs once per process.
+    # Imported here so modules that only need fixture bytes never load libcst.
+    from tools.hdae.patch_cst import apply_all
+
+    out, diffs = apply_all(src, path, set(packs) if packs is not None else None)
+    return out, tuple(diffs)
+
+
+def jsonl_bytes(objs: Iterable[object]) -> bytes:
+    if orjson is not None:
+        return b"\n".join(orjson.dumps(o) for o in objs)
+    return "\n".join(json.dumps(o) for o in objs).encode("utf-8")
+
+
+def load_json_file(path: str | Path) -> Any:
+    # json.loads accepts UTF-8 bytes too, so both paths skip the text decode
+    data = Path(path).read_bytes()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
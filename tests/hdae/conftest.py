@@ -0,0 +1,55 @@
+# ruff: noqa: I001
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, List
+
+import pytest
+
+from tests.hdae._fixtures import fixture_bytes
+
+if TYPE_CHECKING:
+    from tools.hdae.scan import Finding
+
+
+CORE_BEFORE = ("bex_before.py", "sil_before.py", "mda_before.py", "sub_before.py")
+
+
+@pytest.fixture(scope="session")
+def fixture_copy(tmp_path_factory: pytest.TempPathFactory) -> Callable[[str], Path]:
+    """Return a getter that copies a fixture into a session tmp dir at most once.
+
+    Only for read-only use: tests that patch files must copy into their own tmp_path.
+    """
+    base = tmp_path_factory.mktemp("fixture_copies")
+    copies: Dict[str, Path] = {}
+
+    def _get(rel: str) -> Path:
+        p = copies.get(rel)
+        if p is None:
+            p = base / rel
+            p.parent.mkdir(parents=True, exist_ok=True)
+            p.write_bytes(fixture_bytes(rel))
+            copies[rel] = p
+        return p
+
+    return _get
+
+
+@pytest.fixture(scope="session")
+def core_findings(fixture_copy: Callable[[str], Path]) -> List[Finding]:
+    # Scanned once per session; tests only read the findings
+    from tools.hdae.scan import scan_paths
+
+    return scan_paths([str(fixture_copy(name)) for name in CORE_BEFORE])
+
+
+@pytest.fixture(scope="session")
+def libcst_warm() -> None:
+    """Pay LibCST's one-time parser warmup before the first patcher test.
+
+    Opt-in (usefixtures) rather than autouse, so runs that never patch do not import libcst.
+    """
+    import libcst  # required dev dependency: a missing install fails the patcher tests
+
+    libcst.parse_module("x = 1\n")
@@ -1,33 +1,26 @@
 from __future__ import annotations
 # ruff: noqa: I001
 
+import os
 from pathlib import Path
-import json
+import subprocess
 
-from tools.hdae.agent_bridge import emit_tasks, ingest_diffs
+from tests.hdae._fixtures import load_json_file
+from tools.hdae import agent_bridge
+from tools.hdae.agent_bridge import _apply_patches_in, emit_tasks, ingest_diffs
 
 
 ROOT = Path('.')
-FIX = ROOT / 'tests' / 'fixtures' / 'agent'
-
-
-def _clean_tasks_dir() -> None:
-    tdir = ROOT / '.hdae' / 'tasks'
-    if tdir.exists():
-        for p in tdir.glob('*.json'):
-            try:
-                p.unlink()
-            except OSError:
-                pass
+# Plain string: findings and ingest args take str paths, so no Path round-trips
+FIX = os.path.join('tests', 'fixtures', 'agent')
 
 
 def test_emit_generates_packets(tmp_path: Path) -> None:
-    _clean_tasks_dir()
     # Two synthetic ambiguous findings
     findings = [
         {
             'pack': 'BEX-001',
-            'file': str(FIX / 'ambiguous_bex.py'),
+            'file': os.path.join(FIX, 'ambiguous_bex.py'),
             'line': 7,
             'frame': 'def risky()',
             'hint_tokens': ['json.loads'],
@@ -35,7 +28,7 @@ def test_emit_generates_packets(tmp_path: Path) -> None:
         },
         {
             'pack': 'SUB-006',
-            'file': str(FIX / 'ambiguous_sub.py'),
+            'file': os.path.join(FIX, 'ambiguous_sub.py'),
             'line': 4,
             'frame': 'def run_cmd()',
             'hint_tokens': ['subprocess.run'],
@@ -43,11 +36,11 @@ def test_emit_generates_packets(tmp_path: Path) -> None:
             'message': 'uses shell=True',
         },
     ]
-    written = emit_tasks(findings)
+    written = emit_tasks(findings, out_dir=os.path.join(tmp_path, '.hdae', 'tasks'))
     assert written, 'no task packets produced'
     # Validate fields
     for w in written:
-        data = json.loads(Path(w).read_text(encoding='utf-8'))
+        data = load_json_file(w)
         for k in ('tf_id', 'code_frame', 'allowed_transforms', 'decision_rule', 'hints'):
             assert k in data
 
@@ -62,10 +55,10 @@ def test_ingest_ok_then_idempotent(monkeypatch) -> None:
             marker.unlink()
         except OSError:
             pass
-    res = ingest_diffs(str(FIX / 'diffs_ok'))
+    res = ingest_diffs(os.path.join(FIX, 'diffs_ok'))
     assert res['accepted'] >= 1 and res['waived'] == 0
     # Re-ingest same diff should be a no-op
-    res2 = ingest_diffs(str(FIX / 'diffs_ok'))
+    res2 = ingest_diffs(os.path.join(FIX, 'diffs_ok'))
     assert res2['accepted'] == 0 and res2['waived'] == 0
 
 
@@ -78,8 +71,36 @@ def test_ingest_bad_yields_waiver(monkeypatch) -> None:
             wfile.unlink()
         except OSError:
             pass
-    res = ingest_diffs(str(FIX / 'diffs_bad'))
+    res = ingest_diffs(os.path.join(FIX, 'diffs_bad'))
     assert res['accepted'] == 0 and res['waived'] == 1
     assert wfile.exists()
     content = wfile.read_text(encoding='utf-8')
     assert content.strip() != ''
+
+
+def _new_file_diff(name: str) -> str:
+    return f"diff --git a/{name} b/{name}\nnew file mode 100644\n--- /dev/null\n+++ b/{name}\n@@ -0,0 +1 @@\n+x\n"
+
+
+def test_apply_patches_in_logs_one_line_per_applied_file(tmp_path: Path) -> None:
+    subprocess.run(['git', 'init', '-q', str(tmp_path)], check=True)
+    # Batched path: the series file is what gets applied (and it is cleaned up)
+    ok, log = _apply_patches_in(str(tmp_path), [_new_file_diff('a.txt'), _new_file_diff('b.txt')])
+    assert ok and log == 'applied: .hdae.patch.series.diff\n'
+    assert not (tmp_path / '.hdae.patch.series.diff').exists()
+    # a.txt now exists, so the series fails and the per-patch replay logs line by line
+    ok, log = _apply_patches_in(str(tmp_path), [_new_file_diff('c.txt'), _new_file_diff('a.txt')])
+    assert not ok and log.startswith('applied: .hdae.patch.1.diff\n')
+
+
+
+def test_accept_into_main_skips_patches_already_applied_by_earlier_ones(tmp_path: Path, monkeypatch) -> None:
+    subprocess.run(['git', 'init', '-q', str(tmp_path)], check=True)
+    monkeypatch.setattr(agent_bridge, 'ROOT', str(tmp_path))
+    (tmp_path / 'm.txt').write_text('a\n', encoding='utf-8')
+    change = '--- a/m.txt\n+++ b/m.txt\n@@ -1 +1 @@\n-a\n+b\n'
+    # Same change twice (differently spelled), plus an exact repeat: each lands once
+    diffs = ['diff --git a/m.txt b/m.txt\n' + change, change, change]
+    assert agent_bridge._accept_into_main(diffs) == 1
+    assert (tmp_path / 'm.txt').read_text(encoding='utf-8') == 'b\n'
+    assert not list(tmp_path.glob('.hdae.accept.*'))
@@ -1,56 +1,50 @@
-import json
+import os
 from pathlib import Path
 
+from tests.hdae._fixtures import load_json_file
 from tools.hdae.agent_bridge import emit
 
-ROOT = Path('.')
 
-
-def _clean_tasks() -> None:
-    tdir = ROOT / '.hdae' / 'tasks'
-    if tdir.exists():
-        for p in tdir.glob('*.json'):
-            try:
-                p.unlink()
-            except OSError:
-                pass
+def _tasks_dir(tmp_path: Path) -> str:
+    # Per-test output dir keeps the repo's .hdae/tasks untouched (xdist-safe)
+    return os.path.join(tmp_path, '.hdae', 'tasks')
 
 
 def test_emit_filters_and_writes(tmp_path: Path) -> None:
-    _clean_tasks()
     a = tmp_path / 'a.py'
     b = tmp_path / 'b.py'
     a.write_text('pass\n', encoding='utf-8')
     b.write_text('pass\n', encoding='utf-8')
+    a_file, b_file = str(a), str(b)
     findings = [
         {
             'pack': 'SQL-007',
-            'file': str(a),
+            'file': a_file,
             'line': 1,
             'message': 'sql',
             'hint_tokens': ['execute'],
         },
         {
             'pack': 'TYP-009',
-            'file': str(b),
+            'file': b_file,
             'line': 1,
             'message': 'typ',
             'hint_tokens': [],
         },
         {
             'pack': 'BEX-001',
-            'file': str(a),
+            'file': a_file,
             'line': 1,
             'message': 'bex',
             'hint_tokens': [],
         },
     ]
-    written = emit(findings)
+    written = emit(findings, out_dir=_tasks_dir(tmp_path))
     assert len(written) == 2
-    names = {Path(w).name for w in written}
+    names = {os.path.basename(w) for w in written}
     assert names == {'SQL-007-001.json', 'TYP-009-001.json'}
     for w in written:
-        data = json.loads(Path(w).read_text(encoding='utf-8'))
+        data = load_json_file(w)
         assert set(data) == {
             'tf_id',
             'file',
@@ -63,13 +57,12 @@ def test_emit_filters_and_writes(tmp_path: Path) -> None:
 
 
 def test_emit_pack_filter(tmp_path: Path) -> None:
-    _clean_tasks()
     f = {
         'pack': 'SQL-007',
-        'file': str(tmp_path / 'x.py'),
+        'file': os.path.join(tmp_path, 'x.py'),
         'line': 1,
         'message': 'x',
         'hint_tokens': [],
     }
-    written = emit([f], packs={'TYP-009'})
+    written = emit([f], packs={'TYP-009'}, out_dir=_tasks_dir(tmp_path))
     assert written == []
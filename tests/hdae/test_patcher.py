@@ -1,48 +1,27 @@
 # ruff: noqa: I001
 from __future__ import annotations
 
-from pathlib import Path
+import pytest
 
-from tools.hdae.patch_cst import apply_all
+from tests.hdae._fixtures import apply_all_cached, fixture_stripped, fixture_text
 
 
-FIX = Path("tests/fixtures")
+# The patcher is LibCST-based (a required dev dependency)
+pytestmark = pytest.mark.usefixtures("libcst_warm")
 
 
 def _patch_file(before_name: str) -> tuple[str, str]:
-    src = (FIX / before_name).read_text(encoding="utf-8")
-    out, diffs = apply_all(src, before_name)
+    src = fixture_text(before_name)
+    out, diffs = apply_all_cached(src, before_name)
     return out, "\n".join(diffs)
 
 
-def test_bex_idempotent() -> None:
-    out, diff = _patch_file("bex_before.py")
-    assert out.strip() == (FIX / "bex_after.py").read_text(encoding="utf-8").strip()
+@pytest.mark.parametrize("stem", ["bex", "sil", "mda", "sub"])
+def test_core_pack_idempotent(stem: str) -> None:
+    before_name = f"{stem}_before.py"
+    out, _ = _patch_file(before_name)
+    assert out.strip() == fixture_stripped(f"{stem}_after.py")
     # idempotency
-    out2, diff2 = apply_all(out, "bex_before.py")
+    out2, diff2 = apply_all_cached(out, before_name)
     assert out2 == out
-    assert diff2 == []
-
-
-def test_sil_idempotent() -> None:
-    out, _ = _patch_file("sil_before.py")
-    assert out.strip() == (FIX / "sil_after.py").read_text(encoding="utf-8").strip()
-    out2, diff2 = apply_all(out, "sil_before.py")
-    assert out2 == out
-    assert diff2 == []
-
-
-def test_mda_idempotent() -> None:
-    out, _ = _patch_file("mda_before.py")
-    assert out.strip() == (FIX / "mda_after.py").read_text(encoding="utf-8").strip()
-    out2, diff2 = apply_all(out, "mda_before.py")
-    assert out2 == out
-    assert diff2 == []
-
-
-def test_sub_idempotent() -> None:
-    out, _ = _patch_file("sub_before.py")
-    assert out.strip() == (FIX / "sub_after.py").read_text(encoding="utf-8").strip()
-    out2, diff2 = apply_all(out, "sub_before.py")
-    assert out2 == out
-    assert diff2 == []
+    assert diff2 == ()
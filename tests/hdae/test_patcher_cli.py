@@ -0,0 +1,50 @@
+# ruff: noqa: I001
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from tests.hdae._fixtures import expected_diff, fixture_bytes, fixture_text
+from tools.hdae.cli import main
+
+
+# The patcher is LibCST-based (a required dev dependency)
+pytestmark = pytest.mark.usefixtures("libcst_warm")
+
+
+@pytest.mark.parametrize(
+    "pack,before_name,after_name",
+    [
+        ("YAML-015", "yaml_before.py", "yaml_after.py"),
+        ("ERR-011", "err_before.py", "err_after.py"),
+    ],
+)
+def test_pack_cli(
+    pack: str,
+    before_name: str,
+    after_name: str,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    after = fixture_text(f"packs/{after_name}")
+    test_file = tmp_path / before_name
+    test_file.write_bytes(fixture_bytes(f"packs/{before_name}"))
+
+    monkeypatch.chdir(tmp_path)
+    main(["scan", "--packs", pack])
+    scan_out = capsys.readouterr().out.strip().splitlines()
+    assert any(pack in line for line in scan_out)
+
+    main(["propose", "--dry-run", "--packs", pack])
+    diff_out = capsys.readouterr().out
+    assert diff_out == expected_diff(f"packs/{before_name}", f"packs/{after_name}", f"./{test_file.name}")
+
+    main(["propose", "--apply", "--packs", pack])
+    capsys.readouterr()
+    assert test_file.read_text(encoding="utf-8") == after
+
+    # Idempotency: a second dry-run proposes nothing
+    main(["propose", "--dry-run", "--packs", pack])
+    assert capsys.readouterr().out == ""
@@ -0,0 +1,37 @@
+# ruff: noqa: I001
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import pickle
+
+import pytest
+
+from tools.hdae import cli
+
+
+def test_tf_cache_is_json_and_ignores_planted_pickle(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = tmp_path / "tf.json"
+    monkeypatch.setattr(cli, "TF_CACHE_PATH", str(cache))
+    sig = cli._tf_dir_signature()
+    cli._tf_records_at.cache_clear()
+    fresh = cli._tf_records_at(sig)
+    assert json.loads(cache.read_bytes())["stamp"] == cli._tf_cache_stamp()
+
+    # A pickle in the cache slot is never unpickled: it is treated as a miss and replaced
+    cache.write_bytes(pickle.dumps({"stamp": cli._tf_cache_stamp(), "entries": {}}))
+    cli._tf_records_at.cache_clear()
+    assert cli._tf_records_at(sig) == fresh
+    assert set(json.loads(cache.read_bytes())["entries"]) == {p for p, _m, _s in sig}
+    cli._tf_records_at.cache_clear()
+
+
+def test_tf_dir_signature_survives_a_dangling_entry(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    good = tmp_path / "good.yaml"
+    good.write_text("tf_id: X-001\n", encoding="utf-8")
+    (tmp_path / "gone.yaml").symlink_to(tmp_path / "missing.yaml")
+    monkeypatch.setattr(cli, "TF_DIR", str(tmp_path))
+    sig = cli._tf_dir_signature()
+    st = good.stat()
+    # The readable TF keeps its real key; the broken one is listed, not silently dropped
+    assert sig == ((str(tmp_path / "gone.yaml"), -1, -1), (str(good), st.st_mtime_ns, st.st_size))
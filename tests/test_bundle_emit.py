@@ -0,0 +1,20 @@
+import math
+
+import pytest
+
+from tools import bundle_emit
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"x": math.nan},
+        {"x": [math.inf, -math.inf]},
+        {"x": 1e20, "y": 1e-7},
+        [{"deep": [1e16]}],
+        {"b": 0.1, "a": [1, "s", None, True, 2.5]},
+    ],
+)
+def test_canonical_json_matches_stdlib_encoder(value: object) -> None:
+    # The bundle hash must not depend on whether the optional orjson is installed
+    assert bundle_emit.canonical_json(value) == bundle_emit._CANONICAL.encode(value).encode("utf-8")
@@ -0,0 +1,48 @@
+import http.client
+from pathlib import Path
+
+import pytest
+
+from scripts.dev import export_pr_feedback as epf
+
+
+class _FakeRest:
+    """Stands in for RestClient; `fail` lists endpoint suffixes that error out."""
+
+    def __init__(self, fail: tuple[str, ...] = ()) -> None:
+        self.fail = fail
+        self.gets = 0
+        self.list_gets = 0
+
+    def get(self, path: str, accept: str = "") -> dict:
+        self.gets += 1
+        return {"title": "t", "number": 7, "updated_at": "2024-01-01T00:00:00Z"}
+
+    def get_all(self, path: str, accept: str = "") -> list:
+        self.list_gets += 1
+        if path.endswith(self.fail):
+            raise http.client.HTTPException("rate limited")
+        return [{"id": 1, "body": path}]
+
+
+def test_fetch_pr_skips_cache_when_an_endpoint_fails(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(epf, "REST", _FakeRest(fail=("/issues/7/comments",)))
+    _meta, reviews, _rev_comments, issue_comments = epf.fetch_pr(7, tmp_path)
+    assert reviews and issue_comments == []
+    assert not (tmp_path / "PR-7.json").exists()
+
+
+def test_fetch_pr_caches_complete_fetch(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    rest = _FakeRest()
+    monkeypatch.setattr(epf, "REST", rest)
+    first = epf.fetch_pr(7, tmp_path)
+    assert (tmp_path / "PR-7.json").exists()
+    assert (rest.gets, rest.list_gets) == (1, 3)
+    # Warm run: the single PR view is the freshness probe; no list endpoint is hit
+    assert epf.fetch_pr(7, tmp_path) == first
+    assert (rest.gets, rest.list_gets) == (2, 3)
+    # Stale cache: the same single view decides the miss and becomes the meta
+    cache = tmp_path / "PR-7.json"
+    cache.write_bytes(cache.read_bytes().replace(b"2024-01-01T00:00:00Z", b"2023-01-01T00:00:00Z"))
+    assert epf.fetch_pr(7, tmp_path) == first
+    assert (rest.gets, rest.list_gets) == (3, 6)
@@ -2,27 +2,42 @@ import pytest
 
 from gateway import ASK_SIGNAL, STOP_SIGNAL, preflight, should_ask_stop
 
-
-def test_should_ask_stop_returns_constant() -> None:
-    bundle = {
-        "ask_stop": {
-            "ask_if": ["gh auth missing"],
-            "stop_if": ["would violate L1"],
-        }
+BUNDLE = {
+    "ask_stop": {
+        "ask_if": ["gh auth missing"],
+        "stop_if": ["would violate L1"],
     }
-    assert should_ask_stop(bundle, "gh auth missing") == ASK_SIGNAL
-    assert should_ask_stop(bundle, "would violate L1") == STOP_SIGNAL
+}
+
+
+@pytest.mark.parametrize(
+    "signal_input,expected",
+    [("gh auth missing", ASK_SIGNAL), ("would violate L1", STOP_SIGNAL)],
+)
+def test_should_ask_stop_returns_constant(signal_input: str, expected: str) -> None:
+    assert should_ask_stop(BUNDLE, signal_input) == expected
 
 
-def test_preflight_checks_only_declared_gates() -> None:
-    # No gates: should not raise and returns empty list
-    assert preflight({"layers": {"L2": {"gates": []}}}) == []
+def test_should_ask_stop_prefers_stop_and_escapes_patterns() -> None:
+    bundle = {"ask_stop": {"ask_if": ["a.b", "gh auth"], "stop_if": ["(L1)"]}}
+    assert should_ask_stop(bundle, "gh auth missing (L1)") == STOP_SIGNAL
+    assert should_ask_stop(bundle, "axb") is None
+    assert should_ask_stop({"ask_stop": {"ask_if": [], "stop_if": []}}, "anything") is None
 
-    # Non-CLI or logical gates should be ignored and not raise; returns empty list
-    assert preflight({"layers": {"L2": {"gates": ["__definitely_missing_tool__", "docs_updated"]}}}) == []
 
+@pytest.mark.parametrize(
+    "gates",
+    [
+        [],  # no gates
+        ["__definitely_missing_tool__", "docs_updated"],  # non-CLI/logical gates are ignored
+    ],
+)
+def test_preflight_checks_only_declared_gates(gates: list[str]) -> None:
+    assert preflight({"layers": {"L2": {"gates": gates}}}) == []
 
-def test_preflight_missing_cli_tool_raises(monkeypatch) -> None:
+
+@pytest.mark.parametrize("gate", ["ruff", "mypy", "pytest"])
+def test_preflight_missing_cli_tool_raises(monkeypatch, gate: str) -> None:
     # Simulate missing CLI tools by patching detection to always fail
     import gateway.apply_bundle as ab
 
@@ -37,6 +52,11 @@ def test_preflight_missing_cli_tool_raises(monkeypatch) -> None:
         return orig_exists(self)
 
     monkeypatch.setattr(ab.pathlib.Path, "exists", fake_exists, raising=False)
-
-    with pytest.raises(ValueError):
-        preflight({"layers": {"L2": {"gates": ["ruff"]}}})
+    # Drop probes cached by earlier calls so the patched detection is used
+    ab._tool_present.cache_clear()
+
+    try:
+        with pytest.raises(ValueError):
+            preflight({"layers": {"L2": {"gates": [gate]}}})
+    finally:
+        ab._tool_present.cache_clear()
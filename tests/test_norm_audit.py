@@ -0,0 +1,23 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from scripts.dev import norm_audit
+
+
+def test_violation_scan_skips_unreadable_directories(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    (tmp_path / "a.py").write_text("try:\n    pass\nexcept Exception:\n    pass\n", encoding="utf-8")
+    locked = tmp_path / "locked"
+    locked.mkdir()
+    (locked / "b.py").write_text("x = 1\n", encoding="utf-8")
+    real_scandir = os.scandir
+
+    def scandir(path: str) -> "os._ScandirIterator[str]":
+        # chmod 000 does not stop root, so simulate the permission error directly
+        if path == str(locked):
+            raise PermissionError(13, "Permission denied", path)
+        return real_scandir(path)
+
+    monkeypatch.setattr(norm_audit.os, "scandir", scandir)
+    assert norm_audit.scan_violation_mix(tmp_path) == [f"{tmp_path / 'a.py'}: except Exception"]
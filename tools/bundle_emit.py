@@ -13,13 +13,17 @@ from __future__ import annotations
 import argparse
 import hashlib
 import json
+import math
+import mmap
 import os
 import re
 import sys
-from typing import Any, Dict, List, NoReturn, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, NoReturn, Set, Tuple
 
 HERE = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
 ROOT = HERE  # repo root (script lives in tools/)
+_ROOT_PREFIX = os.path.join(ROOT, "")
 
 # Optional PyYAML; fall back to tiny parser if unavailable
 yaml: Any = None
@@ -29,7 +33,29 @@ try:
 except (ImportError, ModuleNotFoundError):  # pragma: no cover - fallback used if PyYAML absent
     yaml = None  # fallback parser below
 
+# Optional orjson; canonical_json falls back to the stdlib encoder
+orjson: Any = None
+try:
+    import orjson as _orjson
+    orjson = _orjson
+except ImportError:
+    orjson = None
+
+# Prefer the libyaml-backed loader (same safe semantics, C speed) when PyYAML has it
+_SafeLoader: Any = None
+if yaml is not None:
+    _SafeLoader = getattr(yaml, "CSafeLoader", None) or yaml.SafeLoader
+
 FRONT_MAT_RE = re.compile(r"^---\s*\n(.*?)\n---\s*\n?", re.S | re.M)
+# Line patterns for the load_yaml fallback parser
+_LIST_ITEM_RE = re.compile(r"^\s*-\s")
+_CONT_KV_RE = re.compile(r"^\s+([A-Za-z0-9_\-]+)\s*:\s*(.*)$")
+_TOP_KV_RE = re.compile(r"^([A-Za-z0-9_\-]+)\s*:\s*(.*)$")
+_QUOTES = "\"'"
+# Reused stdlib encoder: json.dumps with non-default options builds a new one per call
+_CANONICAL = json.JSONEncoder(ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+# Below this many layers, process-pool startup costs more than parsing serially
+PARALLEL_PARSE_MIN_LAYERS = 16
 
 
 def read(path: str) -> str:
@@ -42,14 +68,44 @@ def read_bytes(path: str) -> bytes:
         return f.read()
 
 
+# file_sha256 memo keyed by (abspath, mtime_ns, size): a changed file re-hashes
+_sha_cache: Dict[Tuple[str, int, int], str] = {}
+
+
 def file_sha256(path: str) -> str:
-    return hashlib.sha256(read_bytes(path)).hexdigest()
+    st = os.stat(path)
+    key = (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+    h = _sha_cache.get(key)
+    if h is None:
+        # Stream the file into the hash (no whole-file bytes copy)
+        with open(path, "rb") as f:
+            h = _sha_cache[key] = hashlib.file_digest(f, "sha256").hexdigest()
+    return h
 
 
 def sha256_bytes(b: bytes) -> str:
     return hashlib.sha256(b).hexdigest()
 
 
+def read_hashed(path: str) -> Tuple[str, str]:
+    """Read a text source once; return (text as read() gives it, sha256 of its bytes)."""
+    with open(path, "rb") as f:
+        st = os.fstat(f.fileno())
+        try:
+            # Hash and decode straight from the page cache: no intermediate bytes copy
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                h = hashlib.sha256(mm).hexdigest()
+                text = str(mm, "utf-8")
+        except (OSError, ValueError):  # empty file or unmappable (pipe, special fs)
+            data = f.read()
+            h, text = sha256_bytes(data), data.decode("utf-8")
+    _sha_cache[(os.path.abspath(path), st.st_mtime_ns, st.st_size)] = h
+    if "\r" in text:
+        # Universal-newline translation, matching text-mode read()
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text, h
+
+
 def die(msg: str, code: int = 1) -> NoReturn:
     print(f"[bundle_emit] {msg}", file=sys.stderr)
     sys.exit(code)
@@ -66,38 +122,39 @@ def load_yaml(s: str) -> Any:
     It does NOT support nested mappings or multi-line scalars.
     """
     if yaml is not None:
-        return yaml.safe_load(s)  # type: ignore[no-any-return]
+        return yaml.load(s, Loader=_SafeLoader)
     # minimal fallback parser (covers Meta.yaml shape used here)
     data: Dict[str, Any] = {}
     current_key: str | None = None
     current_item: Dict[str, Any] | None = None
     for line in s.splitlines():
-        if not line.strip():
+        stripped = line.strip()
+        if not stripped:
             continue
         # Start of list item
         if (
-            re.match(r"^\s*-\s", line)
+            _LIST_ITEM_RE.match(line)
             and current_key is not None
             and isinstance(data.get(current_key), list)
         ):
-            item_line = line.strip()[1:].strip()
+            item_line = stripped[1:].strip()
             if ":" in item_line:
                 k, v = item_line.split(":", 1)
-                current_item = {k.strip(): v.strip().strip('\"\'')}
+                current_item = {k.strip(): v.strip().strip(_QUOTES)}
                 data[current_key].append(current_item)
             else:
-                data[current_key].append(item_line.strip().strip('\"\''))
+                data[current_key].append(item_line.strip().strip(_QUOTES))
                 current_item = None
             continue
         # Continuation line for a mapping list item
         if current_key is not None and isinstance(data.get(current_key), list) and isinstance(current_item, dict):
-            cont = re.match(r"^\s+([A-Za-z0-9_\-]+)\s*:\s*(.*)$", line)
+            cont = _CONT_KV_RE.match(line)
             if cont:
                 ck, cv = cont.group(1), cont.group(2)
-                current_item[ck] = cv.strip().strip('\"\'')
+                current_item[ck] = cv.strip().strip(_QUOTES)
                 continue
         # Top-level key: value
-        m = re.match(r"^([A-Za-z0-9_\-]+)\s*:\s*(.*)$", line)
+        m = _TOP_KV_RE.match(line)
         if m:
             k, v = m.group(1), m.group(2)
             v_stripped = v.strip()
@@ -106,7 +163,7 @@ def load_yaml(s: str) -> Any:
                 current_key = k
                 current_item = None
                 continue
-            data[k] = v_stripped.strip('\"\'')
+            data[k] = v_stripped.strip(_QUOTES)
             current_key = k
             current_item = None
     return data
@@ -130,6 +187,13 @@ def validate_meta_shape(meta: Dict[str, Any]) -> None:
             die(f"Meta.yaml: waiver[{i}] must be a mapping with 'id'")
 
 
+def _rel(path: str) -> str:
+    """ROOT-relative form of an absolute, normalized path (prefix strip in the common case)."""
+    if path.startswith(_ROOT_PREFIX):
+        return path[len(_ROOT_PREFIX):]
+    return os.path.relpath(path, ROOT)
+
+
 def resolve_source(spec: str) -> str:
     if spec.startswith("local:"):
         rel = spec.split(":", 1)[1]
@@ -151,17 +215,15 @@ def load_meta(meta_path: str) -> Dict[str, Any]:
         return {}
 
 
-def parse_rules_from_markdown(path: str) -> List[Dict[str, Any]]:
-    content = read(path)
+def parse_rules_from_markdown(path: str, content: str | None = None) -> List[Dict[str, Any]]:
+    if content is None:
+        content = read(path)
     rules: List[Dict[str, Any]] = []
-    idx = 0
-    while True:
-        m = FRONT_MAT_RE.search(content, idx)
-        if not m:
-            break
+    # One linear scan: each block's body runs to the next front-matter start
+    matches = list(FRONT_MAT_RE.finditer(content))
+    for i, m in enumerate(matches):
         fm, body_start = m.group(1), m.end()
-        m2 = FRONT_MAT_RE.search(content, body_start)
-        body_end = m2.start() if m2 else len(content)
+        body_end = matches[i + 1].start() if i + 1 < len(matches) else len(content)
         body = content[body_start:body_end].strip()
         meta = load_yaml(fm) or {}
         rid = meta.get("id") or f"AUTO-{sha256_bytes(fm.encode())[:6]}"
@@ -176,7 +238,6 @@ def parse_rules_from_markdown(path: str) -> List[Dict[str, Any]]:
             "body": body,
         }
         rules.append(r)
-        idx = body_end
     if not rules:
         rid = f"AUTO-{os.path.basename(path)}"
         rules.append(
@@ -194,9 +255,72 @@ def parse_rules_from_markdown(path: str) -> List[Dict[str, Any]]:
     return rules
 
 
+def _floats_match_stdlib(d: Any) -> bool:
+    """False if d holds a float orjson spells differently from stdlib json.
+
+    orjson writes NaN/inf as null and drops the exponent sign/padding (1e20 vs
+    1e+20, 1e-7 vs 1e-07); finite floats in plain positional form agree.
+    """
+    stack = [d]
+    while stack:
+        x = stack.pop()
+        if isinstance(x, dict):
+            stack.extend(x.values())
+        elif isinstance(x, (list, tuple)):
+            stack.extend(x)
+        elif isinstance(x, float) and (not math.isfinite(x) or "e" in repr(x)):
+            return False
+    return True
+
+
 def canonical_json(d: Any) -> bytes:
-    # Stable, whitespace-free JSON (UTF-8) — deterministic across runs
-    return json.dumps(d, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    # Stable, whitespace-free JSON (UTF-8) — deterministic across runs, and the same
+    # bytes with or without orjson: it is used only when it matches stdlib output.
+    # Values it rejects (non-str keys, >64-bit ints, YAML dates via passthrough) and
+    # floats it formats differently go to stdlib json.
+    if orjson is not None and _floats_match_stdlib(d):
+        try:
+            return orjson.dumps(d, option=orjson.OPT_SORT_KEYS | orjson.OPT_PASSTHROUGH_DATETIME)  # type: ignore[no-any-return]
+        except orjson.JSONEncodeError:
+            pass
+    return _CANONICAL.encode(d).encode("utf-8")
+
+
+def write_atomic(path: str, data: bytes) -> None:
+    """Write data to path via a sibling temp file + rename (no partial bundle on crash)."""
+    tmp = path + ".tmp"
+    # Raw fd writes: the payload is already one bytes object, no buffering layer needed
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    os.replace(tmp, path)
+
+
+def _join_members(members: Dict[str, bytes]) -> bytes:
+    # Sorted-key join of `"key":value` fragments == canonical_json of the whole dict
+    return b"{" + b",".join(members[k] for k in sorted(members)) + b"}"
+
+
+def _parse_layer(src: str) -> Tuple[str, List[Dict[str, Any]]] | None:
+    """Hash and parse one layer source; None if the file does not exist."""
+    try:
+        # One open serves the existence probe, the layer hash and rule parsing
+        content, src_sha = read_hashed(src)
+    except FileNotFoundError:
+        return None
+    return src_sha, parse_rules_from_markdown(src, content)
+
+
+def _parse_layers(srcs: List[str]) -> List[Tuple[str, List[Dict[str, Any]]] | None]:
+    if len(srcs) < PARALLEL_PARSE_MIN_LAYERS:
+        return [_parse_layer(src) for src in srcs]
+    # ex.map preserves input order, so the bundle stays deterministic
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+        return list(ex.map(_parse_layer, srcs))
 
 
 def collect(meta_path: str) -> Tuple[
@@ -210,59 +334,62 @@ def collect(meta_path: str) -> Tuple[
     meta_sha = file_sha256(meta_path)
     layers_out: List[Dict[str, Any]] = []
     rules_out: List[Dict[str, Any]] = []
-    ask_if_agg: List[str] = []
-    stop_if_agg: List[str] = []
+    ask_if_set: Set[str] = set()
+    stop_if_set: Set[str] = set()
 
-    for lay in meta.get("layers", []):
+    layers = meta.get("layers", [])
+    srcs = [resolve_source(lay["source"]) for lay in layers]
+    for lay, src, got in zip(layers, srcs, _parse_layers(srcs)):
         lid = lay["id"]
         severity_hint = (lay.get("severity") or "").lower()
-        src = resolve_source(lay["source"])
-        src_sha = file_sha256(src) if os.path.exists(src) else None
+        src_sha, parsed = got if got is not None else (None, None)
         layers_out.append(
             {
                 "id": lid,
                 "name": lay.get("name", lid),
                 "severity": severity_hint or "advice",
                 "source": lay["source"],
-                "resolved": os.path.relpath(src, ROOT) if os.path.exists(src) else None,
+                "resolved": _rel(src) if parsed is not None else None,
                 "sourceSha": src_sha,
             }
         )
-        if not os.path.exists(src):
+        if parsed is None:
             continue
-        for r in parse_rules_from_markdown(src):
-            sev = (r.get("severity") or severity_hint or "advice").lower()
-            checks = r.get("checks") or []
-            # Aggregate ask/stop from agent checks
-            for c in checks:
+        # Aggregate ask/stop from agent checks
+        for r in parsed:
+            for c in r.get("checks") or []:
                 if isinstance(c, dict) and c.get("type") == "agent":
-                    ask_if_agg.extend(c.get("ask_if", []) or [])
-                    stop_if_agg.extend(c.get("stop_if", []) or [])
-            rules_out.append(
-                {
-                    "id": r["id"],
-                    "title": r["title"],
-                    "severity": sev,
-                    "scope": r.get("scope", "repo"),
-                    "layer": lid,
-                    "checks": checks,
-                    "sourceFile": os.path.relpath(r["source_file"], ROOT),
-                    "sourceSha": file_sha256(r["source_file"]) if os.path.exists(r["source_file"]) else None,
-                }
-            )
+                    ask_if_set.update(c.get("ask_if") or ())
+                    stop_if_set.update(c.get("stop_if") or ())
+        # All rules of a layer share one source file: its relpath and sha are per-layer
+        src_rel = layers_out[-1]["resolved"]
+        rules_out.extend(
+            {
+                "id": r["id"],
+                "title": r["title"],
+                "severity": (r.get("severity") or severity_hint or "advice").lower(),
+                "scope": r.get("scope", "repo"),
+                "layer": lid,
+                "checks": r.get("checks") or [],
+                "sourceFile": src_rel,
+                "sourceSha": src_sha,
+            }
+            for r in parsed
+        )
 
     source = {
-        "metaPath": os.path.relpath(meta_path, ROOT),
+        "metaPath": _rel(os.path.abspath(meta_path)),
         "metaSha": meta_sha,
         "files": [
-            {"path": os.path.relpath(x.get("resolved", ""), ROOT), "sha": x.get("sourceSha")}
+            # "resolved" is already ROOT-relative
+            {"path": x["resolved"], "sha": x.get("sourceSha")}
             for x in layers_out
             if x.get("resolved")
         ],
     }
     ask_stop = {
-        "ask_if": sorted(set(ask_if_agg)),
-        "stop_if": sorted(set(stop_if_agg)),
+        "ask_if": sorted(ask_if_set),
+        "stop_if": sorted(stop_if_set),
     }
     return meta, source, layers_out, rules_out, ask_stop
 
@@ -278,15 +405,16 @@ def emit_bundle(meta_path: str, out_path: str, tool_id: str) -> str:
         "ask_stop": ask_stop,
         "waivers": meta.get("waivers", []),
     }
-    # Compute content-hash over bundle **without** hash field
-    pre_hash_bytes = canonical_json(bundle)
-    h = sha256_bytes(pre_hash_bytes)
+    # Compute content-hash over bundle **without** hash field. Each top-level member
+    # is encoded once; the same fragments then form the final document.
+    members = {k: canonical_json(k) + b":" + canonical_json(v) for k, v in bundle.items()}
+    h = sha256_bytes(_join_members(members))
     bundle["hash"] = f"sha256:{h}"
-    final_bytes = canonical_json(bundle)
+    members["hash"] = canonical_json("hash") + b":" + canonical_json(bundle["hash"])
+    final_bytes = _join_members(members)
 
     os.makedirs(os.path.dirname(out_path), exist_ok=True)
-    with open(out_path, "wb") as f:
-        f.write(final_bytes)
+    write_atomic(out_path, final_bytes)
     print(f"[bundle_emit] wrote {out_path} ({len(final_bytes)} bytes)")
     print(f"[bundle_emit] hash={bundle['hash']}")
     return bundle["hash"]
@@ -1,35 +1,55 @@
 from __future__ import annotations
 # ruff: noqa: I001
 
+import functools
 import json
 import os
 import re
 import shutil
 import subprocess
 import tempfile
-import glob
 from dataclasses import dataclass
 import logging
-from typing import Any, Dict, Iterable, List, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
 
-from .cli import _load_all_tfs, _read
+from .cli import _load_tfs_at, _read, _tf_dir_signature
 from .verify import run_verify
 
+orjson: Any = None
+try:  # optional fast JSON codec; stdlib json is the fallback
+    import orjson as _orjson
+
+    orjson = _orjson
+except ImportError:
+    orjson = None
+
 
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir))
 LOG = logging.getLogger(__name__)
 
-SUGGEST_PACKS = {
+# "+++ b/path" or "+++ path" header lines; \r counts as a line break (as in splitlines)
+DIFF_TARGET_RE = re.compile(r"(?:^|(?<=\r))\+\+\+ [^\S\r\n]*(?:b/)?([^\r\n]+)", re.MULTILINE)
+# "+++ b/path" target of a file-creation diff, matched against one line
+NEW_FILE_TARGET_RE = re.compile(r"\+\+\+\s+b/(.+)")
+
+# Frame size for findings without a span
+FRAME_HEAD_LINES = 8
+# Larger files are not kept in the line cache; span frames read just the lines they need
+FRAME_CACHE_MAX_BYTES = 1 << 20
+
+SUGGEST_PACKS = frozenset({
     "SQL-007",
     "TYP-009",
     "ROL-012",
     "IOB-013",
     "CPL-017",
     "DUP-018",
-}
+})
+# BEX-001 hint tokens that imply domain-specific exceptions (see _is_ambiguous_finding)
+AMBIGUOUS_BEX_HINTS = frozenset({"json.load", "json.loads", "[]-indexing", "subprocess.*"})
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskPacket:
     tf_id: str
     file: str
@@ -40,7 +60,10 @@ class TaskPacket:
     hints: List[str]
 
     def to_json(self) -> str:
-        return json.dumps(
+        return self.to_json_bytes().decode("utf-8")
+
+    def to_json_bytes(self) -> bytes:
+        return _json_bytes(
             {
                 "tf_id": self.tf_id,
                 "file": self.file,
@@ -49,86 +72,139 @@ class TaskPacket:
                 "allowed_transforms": self.allowed_transforms,
                 "decision_rule": self.decision_rule,
                 "hints": self.hints,
-            },
-            ensure_ascii=False,
+            }
         )
 
 
+def _json_bytes(obj: Dict[str, Any]) -> bytes:
+    """Compact UTF-8 JSON for task packets (orjson when available, same bytes either way)."""
+    if orjson is not None:
+        return orjson.dumps(obj)  # type: ignore[no-any-return]
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
 def _ensure_dir(path: str) -> None:
     os.makedirs(path, exist_ok=True)
 
 
+def _write_bytes(path: str, data: bytes) -> None:
+    # Raw fd write: packets are small, already-encoded bytes (no text/buffer layers)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+@functools.lru_cache(maxsize=256)
+def _lines_at(file: str, _mtime_ns: int, _size: int) -> Tuple[str, ...]:
+    # Stat fields are part of the key only, so an edited file is re-read
+    return tuple(_read(file).splitlines())
+
+
+def _head_lines(file: str, n: int) -> List[str]:
+    """First n lines of file (as splitlines() gives them), reading only as far as needed."""
+    out: List[str] = []
+    with open(file, "r", encoding="utf-8") as f:
+        for raw in f:
+            # splitlines() also breaks on \v, \f, \u2028, ... within one physical line
+            out.extend(raw.splitlines())
+            if len(out) >= n:
+                break
+    return out[:n]
+
+
 def _extract_frame(file: str, span: Tuple[int, int] | None, fallback: str) -> str:
+    if not span:
+        # first 8 lines as a small frame; no need to read (or cache) the whole file
+        try:
+            return "\n".join(_head_lines(file, FRAME_HEAD_LINES))
+        except OSError:
+            return fallback
+    s, e = span
+    pre = max(1, max(1, s) - 2)
     try:
-        text = _read(file)
+        st = os.stat(file)
+        if st.st_size > FRAME_CACHE_MAX_BYTES and e + 2 > 0:
+            # Large file: read only up to the frame's last line, and keep it out of the cache
+            return "\n".join(_head_lines(file, e + 2)[pre - 1 :])
+        lines = _lines_at(file, st.st_mtime_ns, st.st_size)
     except OSError:
         return fallback
-    lines = text.splitlines()
-    if not span:
-        # first 8 lines as a small frame
-        return "\n".join(lines[:8])
-    s, e = span
-    s = max(1, s)
     e = min(len(lines), e)
-    pre = max(1, s - 2)
     post = min(len(lines), e + 2)
     return "\n".join(lines[pre - 1 : post])
 
 
-def _load_tf_index() -> Dict[str, Dict[str, Any]]:
+@functools.lru_cache(maxsize=1)
+def _tf_index_at(signature: Tuple[Tuple[str, int, int], ...]) -> Dict[str, Dict[str, Any]]:
     idx: Dict[str, Dict[str, Any]] = {}
-    for _path, tf in _load_all_tfs():
+    for _path, tf in _load_tfs_at(signature):
         tf_id = str(tf.get("tf_id", ""))
         if tf_id:
             idx[tf_id] = tf
     return idx
 
 
-def emit(findings: Iterable[Dict[str, Any]], packs: set[str] | None = None) -> List[str]:
-    """Emit task packets for suggest-only packs.
+def _load_tf_index() -> Dict[str, Dict[str, Any]]:
+    # Shared across emit/emit_tasks calls until a TF file changes; read-only
+    return _tf_index_at(_tf_dir_signature())
+
+
+def emit(findings: Iterable[Dict[str, Any]], packs: set[str] | None = None, out_dir: str | None = None) -> List[str]:
+    """Emit task packets for suggest-only packs (default dir: .hdae/tasks/).
 
     Returns list of written file paths.
     """
-    out_dir = os.path.join(ROOT, ".hdae", "tasks")
+    out_dir = out_dir or os.path.join(ROOT, ".hdae", "tasks")
     _ensure_dir(out_dir)
 
-    allowed = SUGGEST_PACKS if packs is None else {p for p in packs if p in SUGGEST_PACKS}
+    allowed = SUGGEST_PACKS if packs is None else SUGGEST_PACKS.intersection(packs)
 
-    # Clean existing packets for these packs
-    for p in allowed:
-        for exist in glob.glob(os.path.join(out_dir, f"{p}-*.json")):
-            try:
-                os.remove(exist)
-            except OSError:
-                pass
+    # Clean existing packets for these packs: one directory scan for all of them
+    prefixes = tuple(f"{p}-" for p in allowed)
+    with os.scandir(out_dir) as it:
+        stale = [e.path for e in it if e.name.startswith(prefixes) and e.name.endswith(".json")]
+    for exist in stale:
+        try:
+            os.remove(exist)
+        except OSError:
+            pass
 
+    # Most findings belong to other packs: reject them before building any sort key,
+    # and bucket the rest by pack so each pack is sorted on its own
+    buckets: Dict[str, List[Tuple[str, int, Dict[str, Any]]]] = {}
+    for f in findings:
+        pack = f.get("pack") or f.get("tf_id") or ""
+        if not isinstance(pack, str):  # findings carry str packs; coerce anything else
+            pack = str(pack)
+        if pack in allowed:
+            buckets.setdefault(pack, []).append((str(f.get("file", "")), int(f.get("line", 0)), f))
+    if not buckets:
+        # Clean scan: stale packets are gone, and no TF needs loading
+        return []
     tf_index = _load_tf_index()
-    counts: Dict[str, int] = {p: 0 for p in allowed}
     written: List[str] = []
-    for f in sorted(findings, key=lambda d: (
-        str(d.get("pack") or d.get("tf_id") or ""),
-        str(d.get("file", "")),
-        int(d.get("line", 0)),
-    )):
-        pack = str(f.get("pack") or f.get("tf_id") or "")
-        if pack not in allowed:
-            continue
-        counts[pack] = counts.get(pack, 0) + 1
-        path = os.path.join(out_dir, f"{pack}-{counts[pack]:03d}.json")
-        tf = tf_index.get(pack, {})
-        L = tf.get("L", {}) if isinstance(tf, dict) else {}
-        actions = [str(t) for t in L.get("transforms", [])] if isinstance(L, dict) else []
-        data = {
-            "tf_id": pack,
-            "file": str(f.get("file", "")),
-            "line": int(f.get("line", 0)),
-            "message": str(f.get("message", "")),
-            "hints": [str(h) for h in f.get("hint_tokens", [])],
-            "proposed_actions": actions,
-        }
-        with open(path, "w", encoding="utf-8") as fp:
-            json.dump(data, fp, ensure_ascii=False)
-        written.append(path)
+    for pack in sorted(buckets):
+        bucket = buckets[pack]
+        bucket.sort(key=lambda t: t[:2])
+        for seq, (_, _, f) in enumerate(bucket, 1):
+            path = os.path.join(out_dir, f"{pack}-{seq:03d}.json")
+            tf = tf_index.get(pack, {})
+            L = tf.get("L", {}) if isinstance(tf, dict) else {}
+            actions = [str(t) for t in L.get("transforms", [])] if isinstance(L, dict) else []
+            data = {
+                "tf_id": pack,
+                "file": str(f.get("file", "")),
+                "line": int(f.get("line", 0)),
+                "message": str(f.get("message", "")),
+                "hints": [str(h) for h in f.get("hint_tokens", [])],
+                "proposed_actions": actions,
+            }
+            _write_bytes(path, _json_bytes(data))
+            written.append(path)
     return sorted(written)
 
 
@@ -136,30 +212,30 @@ def _is_ambiguous_finding(f: Dict[str, Any]) -> bool:
     # Ambiguity heuristic (kept deterministic):
     # - SUB-006 with message "uses shell=True" → ambiguous (not auto-fixed)
     # - BEX-001 with tokens that imply domain-specific exceptions → require human guidance
-    pack = str(f.get("pack", ""))
-    msg = str(f.get("message", ""))
-    hints = [str(h) for h in f.get("hint_tokens", [])]
-    if pack == "SUB-006" and "shell=True" in msg:
-        return True
-    if pack == "BEX-001" and any(h in hints for h in ["json.load", "json.loads", "[]-indexing", "subprocess.*"]):
-        return True
+    # Pack first: findings of any other pack are rejected without touching message/hints
+    pack = f.get("pack")
+    if pack == "SUB-006":
+        return "shell=True" in str(f.get("message", ""))
+    if pack == "BEX-001":
+        return not AMBIGUOUS_BEX_HINTS.isdisjoint(map(str, f.get("hint_tokens", [])))
     return False
 
 
-def emit_tasks(findings: Iterable[Dict[str, Any]]) -> List[str]:
-    """Emit JSON task packets for ambiguous findings under .hdae/tasks/.
+def emit_tasks(findings: Iterable[Dict[str, Any]], out_dir: str | None = None) -> List[str]:
+    """Emit JSON task packets for ambiguous findings under .hdae/tasks/ (or out_dir).
 
     Returns list of generated file paths.
     """
-    out_dir = os.path.join(ROOT, ".hdae", "tasks")
+    out_dir = out_dir or os.path.join(ROOT, ".hdae", "tasks")
     _ensure_dir(out_dir)
 
+    ambiguous = [f for f in findings if _is_ambiguous_finding(f)]
+    if not ambiguous:
+        return []
     tf_by_id = _load_tf_index()
     written: List[str] = []
     n = 0
-    for f in findings:
-        if not _is_ambiguous_finding(f):
-            continue
+    for f in ambiguous:
         tf_id = str(f.get("pack", ""))
         tf = tf_by_id.get(tf_id, {})
         L = tf.get("L", {}) if isinstance(tf, dict) else {}
@@ -175,8 +251,7 @@ def emit_tasks(findings: Iterable[Dict[str, Any]]) -> List[str]:
         )
         n += 1
         path = os.path.join(out_dir, f"task_{n:03d}_{tf_id}.json")
-        with open(path, "w", encoding="utf-8") as fp:
-            fp.write(packet.to_json())
+        _write_bytes(path, packet.to_json_bytes())
         written.append(path)
     return written
 
@@ -186,33 +261,53 @@ def _git(*args: str, cwd: str | None = None) -> subprocess.CompletedProcess[str]
 
 
 def _parse_diff_targets(diff_text: str) -> List[str]:
-    targets: List[str] = []
-    for line in diff_text.splitlines():
-        if line.startswith("+++ "):
-            # formats: +++ b/path or +++ path
-            m = re.match(r"^\+\+\+\s+(?:b/)?(.+)$", line)
-            if m:
-                p = m.group(1).strip()
-                # exclude /dev/null
-                if p != "/dev/null":
-                    targets.append(p)
-    return targets
+    # One scan over the whole diff; exclude /dev/null (deleted files)
+    return [p for p in (m.group(1).strip() for m in DIFF_TARGET_RE.finditer(diff_text)) if p != "/dev/null"]
+
+
+def _write_patches(cwd: str, diffs: List[str], stem: str) -> List[str]:
+    paths: List[str] = []
+    for i, diff in enumerate(diffs, 1):
+        patch_path = os.path.join(cwd, f".hdae.{stem}.{i}.diff")
+        with open(patch_path, "w", encoding="utf-8") as fp:
+            fp.write(diff)
+        paths.append(patch_path)
+    return paths
+
+
+def _write_series(cwd: str, diffs: List[str], stem: str) -> str:
+    """Write diffs as one patch file; git apply is all-or-nothing per input file."""
+    series_path = os.path.join(cwd, f".hdae.{stem}.series.diff")
+    with open(series_path, "w", encoding="utf-8") as fp:
+        for diff in diffs:
+            fp.write(diff if diff.endswith("\n") else diff + "\n")
+    return series_path
 
 
 def _apply_patches_in(cwd: str, diffs: List[str]) -> Tuple[bool, str]:
     """Apply a list of unified diffs in a git worktree.
 
-    Returns (ok, log). Uses `git apply` for determinism.
+    Returns (ok, log). Uses `git apply` for determinism: one apply for the whole
+    series; on failure, per-patch replay pinpoints the bad patch.
     """
+    if not diffs:
+        return True, ""
+    series = _write_series(cwd, diffs, "patch")
+    try:
+        # One input file is applied atomically: a failure leaves the tree untouched,
+        # so no separate --check pass is needed
+        _git("apply", series, cwd=cwd)
+        return True, f"applied: {os.path.basename(series)}\n"
+    except subprocess.CalledProcessError as e:
+        LOG.debug("agent_bridge: batched apply failed, retrying per patch: %s", e)
+    finally:
+        _remove_patches([series])
+    paths = _write_patches(cwd, diffs, "patch")
     logs: List[str] = []
-    for i, diff in enumerate(diffs, 1):
-        patch_path = os.path.join(cwd, f".hdae.patch.{i}.diff")
-        with open(patch_path, "w", encoding="utf-8") as fp:
-            fp.write(diff)
+    for patch_path in paths:
         try:
-            _git("apply", "--check", patch_path, cwd=cwd)
             _git("apply", patch_path, cwd=cwd)
-            logs.append(f"applied: {os.path.basename(patch_path)}")
+            logs.append(f"applied: {os.path.basename(patch_path)}\n")
         except subprocess.CalledProcessError as e:
             logs.append(e.stdout or "")
             logs.append(e.stderr or "")
@@ -220,6 +315,85 @@ def _apply_patches_in(cwd: str, diffs: List[str]) -> Tuple[bool, str]:
     return True, "".join(logs)
 
 
+def _iter_diff_paths(from_dir: str) -> Iterator[str]:
+    """Yield .diff/.patch files under from_dir: each directory's files (sorted), then its subdirs (sorted).
+
+    Same order as a sorted os.walk, from one scandir per directory; .git is not descended into.
+    """
+    stack = [from_dir]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:  # unreadable directory: skipped, as os.walk does
+            continue
+        subdirs: List[str] = []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir:
+                # Symlinked directories are listed but not followed, like os.walk
+                if entry.name != ".git" and not entry.is_symlink():
+                    subdirs.append(entry.path)
+            elif entry.name.endswith((".diff", ".patch")):
+                yield entry.path
+        # Reverse so the DFS pops subdirectories in name order
+        stack.extend(reversed(subdirs))
+
+
+def _new_file_from_diff(text: str) -> Tuple[str, str] | None:
+    """(target, content) for a file-creation diff, from its first hunk; None without a `+++ b/` target.
+
+    One pass over the lines finds the target and collects the hunk's added lines.
+    """
+    rel: str | None = None
+    added: List[str] = []
+    in_hunk = False
+    hunk_done = False
+    for line in text.splitlines():
+        if rel is None:
+            m = NEW_FILE_TARGET_RE.match(line)
+            if m:
+                rel = m.group(1).strip()
+                continue
+        if hunk_done:
+            continue
+        if line.startswith("@@"):
+            if in_hunk:
+                hunk_done = True
+                if rel is not None:
+                    break
+                continue
+            in_hunk = True
+            continue
+        if in_hunk and line.startswith("+") and not line.startswith("+++"):
+            added.append(line[1:])
+    if rel is None:
+        return None
+    content = "\n".join(added)
+    if content and not content.endswith("\n"):
+        content += "\n"
+    return rel, content
+
+
+def _clone_file(src: str, dst: str) -> None:
+    """Copy src to dst kernel-side; on CoW filesystems copy_file_range shares extents."""
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        remaining = os.fstat(fsrc.fileno()).st_size
+        try:
+            while remaining > 0:
+                n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if n == 0:
+                    break
+                remaining -= n
+            return
+        except (AttributeError, OSError) as e:  # not Linux, or unsupported for this fs pair
+            LOG.debug("agent_bridge: copy_file_range unavailable, using copyfile: %s", e)
+    shutil.copyfile(src, dst)
+
+
 def ingest_diffs(from_dir: str) -> Dict[str, int]:
     """Ingest unified diffs from a directory, verify, and accept or waive.
 
@@ -235,33 +409,14 @@ def ingest_diffs(from_dir: str) -> Dict[str, int]:
     all_diffs: List[str] = []
     apply_diffs: List[str] = []
     new_files: List[Tuple[str, str]] = []  # (relpath, content)
-    for base, dirs, files in os.walk(from_dir):
-        dirs.sort()
-        for name in sorted(files):
-            if not name.endswith((".diff", ".patch")):
-                continue
-            path = os.path.join(base, name)
-            text = _read(path)
-            all_diffs.append(text)
-            if "--- /dev/null" in text:
-                m = re.search(r"^\+\+\+\s+b/(.+)$", text, re.MULTILINE)
-                if m:
-                    rel = m.group(1).strip()
-                    added: List[str] = []
-                    in_hunk = False
-                    for line in text.splitlines():
-                        if line.startswith("@@"):
-                            if in_hunk:
-                                break
-                            in_hunk = True
-                            continue
-                        if in_hunk and line.startswith("+") and not line.startswith("+++"):
-                            added.append(line[1:])
-                    content = "\n".join(added)
-                    if content and not content.endswith("\n"):
-                        content += "\n"
-                    new_files.append((rel, content))
-                    continue
+    for path in _iter_diff_paths(from_dir):
+        # Each diff is read and classified exactly once
+        text = _read(path)
+        all_diffs.append(text)
+        created = _new_file_from_diff(text) if "--- /dev/null" in text else None
+        if created is not None:
+            new_files.append(created)
+        else:
             apply_diffs.append(text)
     if not all_diffs:
         return {"accepted": 0, "waived": 0}
@@ -277,8 +432,9 @@ def ingest_diffs(from_dir: str) -> Dict[str, int]:
                 if os.path.isfile(src):
                     os.makedirs(os.path.dirname(dst), exist_ok=True)
                     try:
-                        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
-                            fdst.write(fsrc.read())
+                        # A real copy, never a hardlink: verify runs in the worktree and
+                        # its edits must not reach the main tree
+                        _clone_file(src, dst)
                     except OSError as e:
                         LOG.debug("agent_bridge: overlay copy failed for %s: %s", rel, e)
         except subprocess.CalledProcessError as e:
@@ -296,20 +452,11 @@ def ingest_diffs(from_dir: str) -> Dict[str, int]:
                 _git("worktree", "remove", "--force", tmp)
                 return {"accepted": 0, "waived": 1}
             vpy = os.path.join(ROOT, ".venv", "bin", "python")
-            old_py = os.environ.get("HDAE_PY")
-            old_scope = os.environ.get("HDAE_VERIFY_SCOPE")
+            # Passed per call: the process environment is never mutated
+            verify_env = {"HDAE_VERIFY_SCOPE": "tools"}
             if os.path.exists(vpy):
-                os.environ["HDAE_PY"] = vpy
-            os.environ["HDAE_VERIFY_SCOPE"] = "tools"
-            ok, _verify_out = run_verify(cwd=tmp)
-            if old_py is None:
-                os.environ.pop("HDAE_PY", None)
-            else:
-                os.environ["HDAE_PY"] = old_py
-            if old_scope is None:
-                os.environ.pop("HDAE_VERIFY_SCOPE", None)
-            else:
-                os.environ["HDAE_VERIFY_SCOPE"] = old_scope
+                verify_env["HDAE_PY"] = vpy
+            ok, _verify_out = run_verify(cwd=tmp, env=verify_env)
             if ok:
                 accepted = 0
                 for rel, content in new_files:
@@ -340,27 +487,68 @@ def ingest_diffs(from_dir: str) -> Dict[str, int]:
 
 def _accept_into_main(diffs: List[str]) -> int:
     """Apply diffs to the main working tree idempotently. Returns count applied."""
-    applied = 0
-    for i, diff in enumerate(diffs, 1):
-        patch_path = os.path.join(ROOT, f".hdae.accept.{i}.diff")
-        with open(patch_path, "w", encoding="utf-8") as fp:
-            fp.write(diff)
+    if not diffs:
+        return 0
+    # A repeated diff is a no-op once its first copy lands; git apply would count it twice
+    diffs = list(dict.fromkeys(diffs))
+    paths = _write_patches(ROOT, diffs, "accept")
+    # Fast path (re-ingest): one reverse check shows the whole series is already applied
+    try:
+        _git("apply", "--reverse", "--check", *paths, cwd=ROOT)
+        _remove_patches(paths)
+        return 0
+    except subprocess.CalledProcessError:
+        pass
+    # Fast path (fresh ingest): the whole series applies forward in one atomic call
+    series = _write_series(ROOT, diffs, "accept")
+    try:
+        _git("apply", series, cwd=ROOT)
+        _remove_patches(paths)
+        return len(diffs)
+    except subprocess.CalledProcessError as e:
+        LOG.debug("agent_bridge: series is partly applied, checking per patch: %s", e)
+    finally:
+        _remove_patches([series])
+    pending: List[str] = []
+    pending_diffs: List[str] = []
+    for patch_path, diff in zip(paths, diffs):
         # Idempotency: if reverse-apply check succeeds, patch is already applied
-        already = False
         try:
             _git("apply", "--reverse", "--check", patch_path, cwd=ROOT)
-            already = True
+            _remove_patches([patch_path])
         except subprocess.CalledProcessError:
-            already = False
-        if already:
-            continue
-        _git("apply", patch_path, cwd=ROOT)
-        applied += 1
+            pending.append(patch_path)
+            pending_diffs.append(diff)
+    if not pending:
+        return 0
+    series = _write_series(ROOT, pending_diffs, "accept")
+    applied = len(pending)
+    try:
+        # Everything not yet applied goes in one all-or-nothing call
+        _git("apply", series, cwd=ROOT)
+    except subprocess.CalledProcessError as e:
+        LOG.debug("agent_bridge: batched accept failed, retrying per patch: %s", e)
+        applied = 0
+        for patch_path in pending:
+            # Re-checked against the tree the earlier patches left (duplicate or stacked diffs)
+            try:
+                _git("apply", "--reverse", "--check", patch_path, cwd=ROOT)
+                continue
+            except subprocess.CalledProcessError:
+                pass
+            _git("apply", patch_path, cwd=ROOT)
+            applied += 1
+    finally:
+        _remove_patches([series, *pending])
+    return applied
+
+
+def _remove_patches(paths: List[str]) -> None:
+    for patch_path in paths:
         try:
             os.remove(patch_path)
         except OSError as e:
             LOG.debug("agent_bridge: remove patch temp failed: %s", e)
-    return applied
 
 
 def _waive_for_diffs(diffs: List[str], reason: str) -> None:
@@ -368,19 +556,26 @@ def _waive_for_diffs(diffs: List[str], reason: str) -> None:
     wdir = os.path.join(ROOT, "docs", "agents", "waivers")
     _ensure_dir(wdir)
     out_path = os.path.join(wdir, f"PR-{pr_num}.md")
-    snippets: List[str] = []
-    for d in diffs:
-        targets = _parse_diff_targets(d)
-        for t in targets:
-            frame = _extract_frame(os.path.join(ROOT, t), None, f"<file {t}>")
-            snippets.append(f"### {t}\n\n```\n{frame}\n```\n")
-    body = [
-        f"WAIVER (reason: {reason})\n",
-        "\n".join(snippets) if snippets else "(no frames)",
-        "\n",
-    ]
     with open(out_path, "a", encoding="utf-8") as fp:
-        fp.write("\n".join(body))
+        # Streamed through the file buffer; no joined copy of all frames is built
+        fp.writelines(_waiver_chunks(diffs, reason))
+
+
+def _waiver_chunks(diffs: List[str], reason: str) -> Iterator[str]:
+    yield f"WAIVER (reason: {reason})\n\n"
+    sep = ""
+    # A file targeted by several diffs is read once per waiver
+    frames: Dict[str, str] = {}
+    for d in diffs:
+        for t in _parse_diff_targets(d):
+            frame = frames.get(t)
+            if frame is None:
+                frame = frames[t] = _extract_frame(os.path.join(ROOT, t), None, f"<file {t}>")
+            yield f"{sep}### {t}\n\n```\n{frame}\n```\n"
+            sep = "\n"
+    if not sep:
+        yield "(no frames)"
+    yield "\n\n"
 
 
 def waive(find: Dict[str, Any], reason: str, pr: int = 0) -> str:
@@ -4,24 +4,44 @@ from __future__ import annotations
 from typing import Any, Dict, List, Tuple
 
 import argparse
-import glob
+import functools
+import hashlib
 import json
 import os
-import re
 import sys
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 
 
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir))
 TF_DIR = os.path.join(ROOT, "tools", "hdae", "tf")
 SCHEMA_PATH = os.path.join(ROOT, "tools", "hdae", "schema", "tf.schema.json")
 
+# Characters allowed in _load_yaml_minimal mapping keys
+_KEY_CHARS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_-")
+# Below this many TF files, thread startup costs more than the (small) reads it overlaps
+PARALLEL_TF_MIN_FILES = 64
+# Parsed + validated TFs persisted across CLI runs; bump the format on layout changes
+TF_CACHE_PATH = os.path.join(ROOT, ".hdae", "cache", "tf.json")
+TF_CACHE_FORMAT = 2
+# Subcommands that read TFs; only these validate them by default
+TF_COMMANDS = frozenset({"scan", "propose", "apply"})
+# Required top-level TF fields, in error-report order
+_REQUIRED_TOP = ("tf_id", "name", "meta", "E", "O", "L", "IO", "verify", "links")
+_REQUIRED_TOP_SET = frozenset(_REQUIRED_TOP)
+
 
 def _read(path: str) -> str:
     with open(path, "r", encoding="utf-8") as f:
         return f.read()
 
 
+def _read_utf8(path: str) -> str:
+    # One binary read + decode, no newline translation: only for text split with splitlines()
+    with open(path, "rb") as f:
+        return f.read().decode("utf-8")
+
+
 def _load_schema() -> Dict[str, Any]:
     try:
         return json.loads(_read(SCHEMA_PATH))
@@ -30,6 +50,17 @@ def _load_schema() -> Dict[str, Any]:
         return {}
 
 
+def _split_key(stripped: str) -> Tuple[str, str] | None:
+    """Split `key<ws>:rest` (key of [A-Za-z0-9_-]) from an lstripped line; None if not a mapping line."""
+    head, sep, rest = stripped.partition(":")
+    if not sep:
+        return None
+    key = head.rstrip()
+    if not key or not _KEY_CHARS.issuperset(key):
+        return None
+    return key, rest
+
+
 def _load_yaml_minimal(s: str) -> Any:
     """Minimal YAML subset loader (mappings + lists of scalars/maps).
 
@@ -45,11 +76,12 @@ def _load_yaml_minimal(s: str) -> Any:
     nested_list_parent: Dict[str, Any] | None = None  # object that owns current_key as list
     for raw in s.splitlines():
         line = raw.rstrip("\n")
-        if not line.strip() or line.lstrip().startswith("#"):
+        stripped = line.lstrip()
+        if not stripped or stripped[0] == "#":
             continue
-        # list item under current_key (top-level or nested under object)
-        if re.match(r"^\s*-\s", line) and current_key is not None:
-            item_text = line.strip()[1:].strip()
+        # list item under current_key (top-level or nested under object): "-" then whitespace
+        if current_key is not None and stripped[0] == "-" and stripped[1:2].isspace():
+            item_text = stripped[1:].strip()
             # Prefer nested list under an object if set
             if nested_list_parent is not None and isinstance(nested_list_parent.get(current_key), list):
                 container = nested_list_parent[current_key]
@@ -68,11 +100,13 @@ def _load_yaml_minimal(s: str) -> Any:
         # continuation mapping lines under last list item
         # no mapping continuation under list items (not needed for TF files)
 
+        kv = _split_key(stripped)
+        if kv is None:
+            continue
         # continuation mapping lines under last object mapping (e.g., meta: ...)
-        if current_obj is not None:
-            m3 = re.match(r"^\s+([A-Za-z0-9_\-]+)\s*:\s*(.*)$", line)
-            if m3:
-                ck, cv = m3.group(1), m3.group(2)
+        if len(stripped) != len(line):
+            if current_obj is not None:
+                ck, cv = kv
                 v = cv.strip()
                 if v in ("", "[]"):
                     current_obj[ck] = []
@@ -84,30 +118,28 @@ def _load_yaml_minimal(s: str) -> Any:
                     current_obj[ck] = v.strip("'\"")
                     nested_list_parent = None
                 # Do not change current_key here; lists under this key will update current_key later
-                continue
+            continue
 
-        # top-level mapping
-        m2 = re.match(r"^([A-Za-z0-9_\-]+)\s*:\s*(.*)$", line)
-        if m2:
-            k, v = m2.group(1), m2.group(2)
-            v_stripped = v.strip()
-            if v_stripped in ("", "[]", "{}"):
-                # For top-level keys, prefer object when blank unless explicit []
-                if v_stripped == "[]":
-                    data[k] = []
-                else:
-                    data[k] = {}
+        # top-level mapping (no indentation)
+        k, v = kv
+        v_stripped = v.strip()
+        if v_stripped in ("", "[]", "{}"):
+            # For top-level keys, prefer object when blank unless explicit []
+            if v_stripped == "[]":
+                data[k] = []
             else:
-                data[k] = v_stripped.strip("'\"")
-            current_key = k
-            current_obj = data[k] if isinstance(data[k], dict) else None
-            nested_list_parent = None
+                data[k] = {}
+        else:
+            data[k] = v_stripped.strip("'\"")
+        current_key = k
+        current_obj = data[k] if isinstance(data[k], dict) else None
+        nested_list_parent = None
     return data
 
 
 def _load_tf(path: str) -> Dict[str, Any]:
     try:
-        return _load_yaml_minimal(_read(path)) or {}
+        return _load_yaml_minimal(_read_utf8(path)) or {}
     except (json.JSONDecodeError, KeyError, IndexError, ValueError, TypeError, OSError, subprocess.CalledProcessError) as e:
         raise ValueError(f"failed to load YAML: {path}: {e}") from e
 
@@ -131,18 +163,16 @@ def _to_bool(x: Any) -> bool:
 
 
 def _must_be_list_of_str(x: Any) -> bool:
-    return isinstance(x, list) and all(isinstance(i, str) for i in x)
+    # Bound isinstance check mapped in C: no generator frame per element
+    return isinstance(x, list) and all(map(str.__instancecheck__, x))
 
 
 def _validate_tf(tf: Dict[str, Any]) -> List[str]:
-    errors: List[str] = []
-    # required top-level fields
-    for k in ("tf_id", "name", "meta", "E", "O", "L", "IO", "verify", "links"):
-        if k not in tf:
-            errors.append(f"missing field: {k}")
-    if errors:
-        return errors
+    # required top-level fields: one C-level subset test on the common (complete) path
+    if not _REQUIRED_TOP_SET.issubset(tf):
+        return [f"missing field: {k}" for k in _REQUIRED_TOP if k not in tf]
 
+    errors: List[str] = []
     if not _must_be_str(tf["tf_id"]):
         errors.append(f"tf_id must be string (got {_type_name(tf['tf_id'])})")
     if not _must_be_str(tf["name"]):
@@ -233,13 +263,130 @@ def _validate_tf(tf: Dict[str, Any]) -> List[str]:
     return errors
 
 
-def _load_all_tfs() -> List[Tuple[str, Dict[str, Any]]]:
-    out: List[Tuple[str, Dict[str, Any]]] = []
-    for path in sorted(glob.glob(os.path.join(TF_DIR, "*.yaml"))):
-        out.append((path, _load_tf(path)))
+def _tf_dir_signature() -> Tuple[Tuple[str, int, int], ...]:
+    """(path, mtime_ns, size) of each TF file, sorted by path; same files as TF_DIR/*.yaml."""
+    try:
+        with os.scandir(TF_DIR) as it:
+            entries = [e for e in it if e.name.endswith(".yaml") and not e.name.startswith(".")]
+    except FileNotFoundError:
+        return ()
+    sig: List[Tuple[str, int, int]] = []
+    for e in entries:
+        try:
+            st = e.stat()
+        except OSError:
+            # Dangling symlink / deleted mid-scan: keep the path (never a cache hit) so
+            # loading it reports the error, as the glob-based listing did
+            sig.append((e.path, -1, -1))
+            continue
+        sig.append((e.path, st.st_mtime_ns, st.st_size))
+    return tuple(sorted(sig))
+
+
+def _load_tf_files(paths: List[str]) -> List[Dict[str, Any]]:
+    if len(paths) < PARALLEL_TF_MIN_FILES:
+        return [_load_tf(path) for path in paths]
+    # Reads overlap across threads; ex.map keeps path order
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as ex:
+        return list(ex.map(_load_tf, paths))
+
+
+def _tf_cache_stamp() -> List[Any]:
+    # Parser and validator live in this file: any edit to its content invalidates every entry
+    with open(__file__, "rb") as f:
+        return [TF_CACHE_FORMAT, hashlib.sha256(f.read()).hexdigest()]
+
+
+def _read_tf_cache(stamp: List[Any]) -> Dict[str, Tuple[Tuple[int, int], Dict[str, Any], Tuple[str, ...]]]:
+    """Cached (key, tf, errors) per TF path; malformed entries are dropped.
+
+    Plain JSON, never pickle: the cache sits in the working tree, so loading it must not run code.
+    """
+    try:
+        with open(TF_CACHE_PATH, "rb") as f:
+            obj = json.loads(f.read())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(obj, dict) or obj.get("stamp") != stamp or not isinstance(obj.get("entries"), dict):
+        return {}
+    out: Dict[str, Tuple[Tuple[int, int], Dict[str, Any], Tuple[str, ...]]] = {}
+    for path, entry in obj["entries"].items():
+        if not (isinstance(entry, list) and len(entry) == 3):
+            continue
+        key, tf, errs = entry
+        if (
+            isinstance(key, list)
+            and len(key) == 2
+            and all(type(k) is int for k in key)
+            and isinstance(tf, dict)
+            and _must_be_list_of_str(errs)
+        ):
+            out[path] = ((key[0], key[1]), tf, tuple(errs))
     return out
 
 
+def _write_tf_cache(stamp: List[Any], entries: Dict[str, Any]) -> None:
+    tmp = f"{TF_CACHE_PATH}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(TF_CACHE_PATH), exist_ok=True)
+        with open(tmp, "wb") as f:
+            f.write(json.dumps({"stamp": stamp, "entries": entries}, ensure_ascii=False).encode("utf-8"))
+        os.replace(tmp, TF_CACHE_PATH)
+    except (OSError, TypeError, ValueError):
+        # The cache is only an optimization (read-only checkout, full disk, ...)
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+
+
+@functools.lru_cache(maxsize=1)
+def _tf_records_at(
+    signature: Tuple[Tuple[str, int, int], ...],
+) -> Tuple[Tuple[str, Dict[str, Any], Tuple[str, ...]], ...]:
+    """(path, tf, validation errors) per TF file.
+
+    Entries of TF_CACHE_PATH whose (mtime_ns, size) still match are reused, so a
+    warm CLI run parses and validates nothing; only changed files are reloaded.
+    """
+    stamp = _tf_cache_stamp()
+    cached = _read_tf_cache(stamp)
+    misses = [path for path, mtime_ns, size in signature if path not in cached or cached[path][0] != (mtime_ns, size)]
+    loaded = dict(zip(misses, _load_tf_files(misses)))
+    entries: Dict[str, Any] = {}
+    records: List[Tuple[str, Dict[str, Any], Tuple[str, ...]]] = []
+    for path, mtime_ns, size in signature:
+        if path in loaded:
+            tf = loaded[path]
+            errs = tuple(_validate_tf(tf))
+        else:
+            _key, tf, errs = cached[path]
+        entries[path] = ((mtime_ns, size), tf, errs)
+        records.append((path, tf, errs))
+    if misses or entries.keys() != cached.keys():
+        _write_tf_cache(stamp, entries)
+    return tuple(records)
+
+
+def _load_tfs_at(signature: Tuple[Tuple[str, int, int], ...]) -> Tuple[Tuple[str, Dict[str, Any]], ...]:
+    # The dicts are shared between callers and must be treated as read-only
+    return tuple((path, tf) for path, tf, _errs in _tf_records_at(signature))
+
+
+def _check_tfs() -> int:
+    """Print TF schema errors and return 2 if there are any, else 0."""
+    # Validation results are cached with the parsed TFs (see _tf_records_at)
+    errors: List[str] = []
+    for path, _tf, es in _tf_records_at(_tf_dir_signature()):
+        if es:
+            errors.append(path + "\n  - " + "\n  - ".join(es))
+    if errors:
+        print("TF schema errors:")
+        print("\n".join(errors))
+        return 2
+    return 0
+
+
 def main(argv: List[str] | None = None) -> int:
     ap = argparse.ArgumentParser(
         prog="hdae",
@@ -256,20 +403,19 @@ def main(argv: List[str] | None = None) -> int:
     ap.add_argument("--packs", default="", help="Comma-separated TF ids to include")
     ap.add_argument("--dry-run", action="store_true", help="For propose: print unified diffs")
     ap.add_argument("--apply", action="store_true", help="For propose: apply patches in-place")
+    ap.add_argument(
+        "--validate-tfs",
+        action="store_true",
+        help="Validate TFs even for commands that do not read them (verify, agent ingest)",
+    )
     # Parse known args to allow agent subcommands
     cmd, rest = ap.parse_known_args(argv)
 
-    # Always validate TFs for any subcommand
-    tfs = _load_all_tfs()
-    errors: List[str] = []
-    for path, tf in tfs:
-        es = _validate_tf(tf)
-        if es:
-            errors.append(path + "\n  - " + "\n  - ".join(es))
-    if errors:
-        print("TF schema errors:")
-        print("\n".join(errors))
-        return 2
+    # Validate TFs for the commands that consume them (agent emit checks its own)
+    if cmd.validate_tfs or cmd.command in TF_COMMANDS:
+        rc = _check_tfs()
+        if rc:
+            return rc
 
     packs: set[str] | None = None
     if cmd.packs:
@@ -293,24 +439,21 @@ def main(argv: List[str] | None = None) -> int:
         dry = bool(cmd.dry_run) or cmd.command == "propose"
         do_apply = bool(cmd.apply) or cmd.command == "apply"
         rc = 0
-        files = list_repo_py_files(".")
+        # list_repo_py_files(".") yields "./"-prefixed paths; tests/ is skipped before any read
+        tests_prefix = os.path.join(os.curdir, "tests", "")
+        files = [p for p in list_repo_py_files(".") if not p.startswith(tests_prefix)]
         if packs:
             findings = scan_paths(files)
             keep = {f.file for f in findings if f.pack in packs}
             files = [f for f in files if f in keep]
         for p in files:
-            if os.path.relpath(p).startswith("tests/"):
-                continue
-            try:
-                s = _read(p)
-            except OSError:
-                raise
+            s = _read(p)
             new, diffs = apply_all(s, p, packs)
             if diffs:
                 for d in diffs:
                     if dry:
                         print(d, end="")
-                if do_apply:
+                if do_apply and new != s:
                     with open(p, "w", encoding="utf-8") as fp:
                         fp.write(new)
                 rc = rc or 0
@@ -333,6 +476,10 @@ def main(argv: List[str] | None = None) -> int:
         if args.sub == "emit":
             from .agent_bridge import emit as emit_packets
 
+            rc = _check_tfs()
+            if rc:
+                return rc
+
             data: List[Dict[str, Any]] = []
             for line in sys.stdin:
                 line = line.strip()
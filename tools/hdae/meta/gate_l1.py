@@ -2,14 +2,24 @@ from __future__ import annotations
 # ruff: noqa: I001
 
 import argparse
+import functools
 import json
 import os
 import re
 import subprocess
 import sys
-from typing import Dict, List, Set, Tuple
+from collections import Counter
+from typing import AbstractSet, Any, Dict, FrozenSet, List, Set, Tuple
 import logging
 
+orjson: Any = None
+try:  # optional fast JSON codec; stdlib json is the fallback
+    import orjson as _orjson
+
+    orjson = _orjson
+except ImportError:
+    orjson = None
+
 # Resolve repo root from this file location
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, os.pardir))
 if ROOT not in sys.path:
@@ -23,6 +33,12 @@ def _read(path: str) -> str:
         return f.read()
 
 
+def _read_utf8(path: str) -> str:
+    # One binary read + decode, no newline translation: only for text split with splitlines()
+    with open(path, "rb") as f:
+        return f.read().decode("utf-8")
+
+
 def _load_yaml_minimal(s: str) -> Dict[str, object]:
     # Importing local minimal YAML to avoid external deps
     from tools.hdae.cli import _load_yaml_minimal as _yaml
@@ -33,20 +49,33 @@ def _load_yaml_minimal(s: str) -> Dict[str, object]:
     return data  # type: ignore[return-value]
 
 
+def _loads(raw: bytes) -> object:
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # stdlib json also accepts NaN/Infinity and big ints; let it decide
+    return json.loads(raw)
+
+
 def _jsonl_lines(path: str) -> List[Dict[str, object]]:
     out: List[Dict[str, object]] = []
     try:
-        text = _read(path)
+        # Streamed line by line as bytes: no whole-file text copy, no decode pass
+        with open(path, "rb") as fh:
+            for raw in fh:
+                raw = raw.strip()
+                if not raw:
+                    continue
+                try:
+                    obj = _loads(raw)
+                    if isinstance(obj, dict):
+                        out.append(obj)
+                except json.JSONDecodeError as e:
+                    LOG.debug("gate: skip bad JSONL line: %s", e)
+                    continue
     except OSError:
         return out
-    for ln in [line for line in text.splitlines() if line.strip()]:
-        try:
-            obj = json.loads(ln)
-            if isinstance(obj, dict):
-                out.append(obj)
-        except json.JSONDecodeError as e:
-            LOG.debug("gate: skip bad JSONL line: %s", e)
-            continue
     return out
 
 
@@ -54,44 +83,59 @@ def _discover_changed_files(base_ref: str) -> Set[str]:
     # Prefer origin/<base>...HEAD; fallback to <base>...HEAD
     for base in (f"origin/{base_ref}", base_ref):
         try:
+            # -z: NUL-separated, unquoted names; raw bytes decoded once, no per-line strip
             cp = subprocess.run(
-                ["git", "diff", "--name-only", f"{base}...HEAD"],
+                ["git", "diff", "--name-only", "-z", f"{base}...HEAD"],
                 check=True,
-                text=True,
                 capture_output=True,
                 cwd=ROOT,
             )
-            files = [line.strip() for line in cp.stdout.splitlines() if line.strip()]
-            return set(files)
+            return set(filter(None, cp.stdout.decode("utf-8").split("\0")))
         except subprocess.CalledProcessError as e:
             LOG.debug("gate: git diff failed on base %s: %s", base, e)
             continue
+        except OSError as e:
+            # git not installed: no changed-file filter, every gated finding counts
+            LOG.debug("gate: git unavailable: %s", e)
+            break
     return set()
 
 
+@functools.lru_cache(maxsize=4)
+def _load_config_at(path: str, mtime_ns: int, size: int) -> Dict[str, object]:
+    # Keyed by stat so edits re-parse; the shared dict is read-only for callers
+    return _load_yaml_minimal(_read_utf8(path))
+
+
 def _load_config() -> Dict[str, object]:
     try:
-        return _load_yaml_minimal(_read(CONFIG_PATH))
+        st = os.stat(CONFIG_PATH)
+        return _load_config_at(CONFIG_PATH, st.st_mtime_ns, st.st_size)
     except OSError:
         return {}
 
 
-def _count_waivers(conf: Dict[str, object], pr: int, gate_ids: Set[str], cwd: str) -> int:
+@functools.lru_cache(maxsize=8)
+def _waiver_regex(regex: str) -> re.Pattern[str] | None:
+    """Compile the configured waiver pattern once per process; None if it is invalid."""
+    try:
+        return re.compile(regex)
+    except re.error:
+        return None
+
+
+def _count_waivers(conf: Dict[str, object], pr: int, gate_ids: AbstractSet[str]) -> int:
     pattern = str(conf.get("waiver_file_pattern", "docs/agents/waivers/PR-{pr}.md"))
     regex = str(conf.get("waiver_tf_regex", r"\btf_id\s*:\s*([A-Z]+-\d{3})\b"))
-    path = os.path.abspath(os.path.join(cwd, pattern.format(pr=pr)))
-    if not os.path.exists(path):
-        return 0
+    # Relative paths resolve against the working directory at open(); a missing file is an OSError
     try:
-        text = _read(path)
+        text = _read(pattern.format(pr=pr))
     except OSError:
         return 0
-    matches: List[str]
-    try:
-        matches = re.findall(regex, text)
-    except re.error:
-        matches = []
-    count = sum(1 for m in matches if str(m) in gate_ids)
+    compiled = _waiver_regex(regex)
+    matches: List[str] = compiled.findall(text) if compiled is not None else []
+    # findall yields str for 0/1-group patterns and tuples otherwise; neither needs str()
+    count = sum(map(gate_ids.__contains__, matches))
     if count:
         return count
     # Fallback: count occurrences of gate IDs directly
@@ -107,18 +151,13 @@ def _count_waivers(conf: Dict[str, object], pr: int, gate_ids: Set[str], cwd: st
 def _compute_gate(pr: int, base: str | None, changed_list_file: str | None) -> Tuple[Dict[str, object], int]:
     conf = _load_config()
     ids = conf.get("gate_on_tf_ids", [])
-    gate_ids: Set[str] = set()
-    if isinstance(ids, list):
-        for x in ids:
-            gate_ids.add(str(x))
+    gate_ids: FrozenSet[str] = frozenset(str(x) for x in ids) if isinstance(ids, list) else frozenset()
     scan_path = str(conf.get("scan_path", "hdae-scan.jsonl"))
-    cwd = os.getcwd()
-    scan_abs = os.path.abspath(os.path.join(cwd, scan_path))
     # Determine changed files
     changed: Set[str] = set()
     if changed_list_file:
         try:
-            lines = _read(changed_list_file)
+            lines = _read_utf8(changed_list_file)
             changed = {line.strip() for line in lines.splitlines() if line.strip()}
         except OSError:
             changed = set()
@@ -128,21 +167,25 @@ def _compute_gate(pr: int, base: str | None, changed_list_file: str | None) -> T
         else:
             changed = set()
 
-    items = _jsonl_lines(scan_abs)
+    items = _jsonl_lines(scan_path)
     total_all = len(items)
-    l1_in_pr = 0
+    # Gated findings per file, in one pass; the PR footprint is then |changed| lookups
+    per_file: Counter[str] = Counter()
     for obj in items:
-        tf_id = str(obj.get("tf_id") or obj.get("pack") or "")
-        fpath = str(obj.get("file") or obj.get("path") or obj.get("filename") or "")
-        if not tf_id or not fpath:
+        # tf_id first: ungated records never pay for the file-key lookups
+        tf = obj.get("tf_id") or obj.get("pack")
+        if not tf or (tf if type(tf) is str else str(tf)) not in gate_ids:
             continue
-        if tf_id not in gate_ids:
+        fp = obj.get("file") or obj.get("path") or obj.get("filename")
+        if not fp:
             continue
-        if changed and fpath not in changed:
-            continue
-        l1_in_pr += 1
+        per_file[fp if type(fp) is str else str(fp)] += 1
+    if changed:
+        l1_in_pr = sum(per_file[f] for f in changed if f in per_file)
+    else:
+        l1_in_pr = sum(per_file.values())
 
-    waivers = _count_waivers(conf, pr, gate_ids, cwd)
+    waivers = _count_waivers(conf, pr, gate_ids)
     remaining = max(l1_in_pr - waivers, 0)
     result: Dict[str, object] = {
         "total_all": total_all,
@@ -17,6 +17,7 @@ from __future__ import annotations
 
 import ast
 import difflib
+import functools
 from dataclasses import dataclass
 from typing import List, Tuple
 
@@ -288,9 +289,16 @@ class YamlSafeLoadTransformer(cst.CSTTransformer):
         return updated_node
 
 
+@functools.lru_cache(maxsize=8)
+def _parse_cst(src: str) -> cst.Module:
+    # LibCST trees are immutable, so a parse can be shared: consecutive CST fixers
+    # that leave the text unchanged, and an idempotency re-run, reuse one tree
+    return cst.parse_module(src)
+
+
 def fix_yaml(src: str, path: str) -> Tuple[str, str]:
     try:
-        mod = cst.parse_module(src)
+        mod = _parse_cst(src)
     except Exception:
         return src, ""
     new_mod = mod.visit(YamlSafeLoadTransformer())
@@ -354,7 +362,7 @@ class Err011AddCause(cst.CSTTransformer):
 
 def fix_err(src: str, path: str) -> Tuple[str, str]:
     try:
-        mod = cst.parse_module(src)
+        mod = _parse_cst(src)
     except Exception:
         return src, ""
     new_mod = mod.visit(Err011AddCause())
@@ -3,18 +3,21 @@ from __future__ import annotations
 import os
 import subprocess
 import sys
-from typing import List, Tuple
+from typing import List, Mapping, Tuple
 
 
-def run_verify(cwd: str | None = None) -> Tuple[bool, str]:
+def run_verify(cwd: str | None = None, env: Mapping[str, str] | None = None) -> Tuple[bool, str]:
     """Run ruff + mypy + pytest and return (ok, combined_stdout).
 
     Deterministic: no randomness or wall-clock branching.
     To avoid recursive pytest during outer pytest runs, set env
     HDAE_SKIP_INNER_PYTEST=1 to skip the pytest stage.
+    `env` overrides variables for this run and its checks only; os.environ is untouched.
     """
-    py = os.environ.get("HDAE_PY", sys.executable)
-    scope = os.environ.get("HDAE_VERIFY_SCOPE", "all")
+    environ = {**os.environ, **env} if env else None
+    lookup = environ if environ is not None else os.environ
+    py = lookup.get("HDAE_PY", sys.executable)
+    scope = lookup.get("HDAE_VERIFY_SCOPE", "all")
     if scope == "tools":
         ruff_targets = ["tools/hdae"]
         mypy_targets = ["tools/hdae"]
@@ -25,13 +28,13 @@ def run_verify(cwd: str | None = None) -> Tuple[bool, str]:
         [py, "-m", "ruff", "check", *ruff_targets],
         [py, "-m", "mypy", "--explicit-package-bases", *mypy_targets],
     ]
-    if os.environ.get("HDAE_SKIP_INNER_PYTEST") not in {"1", "true", "True"}:
+    if lookup.get("HDAE_SKIP_INNER_PYTEST") not in {"1", "true", "True"}:
         checks.append([py, "-m", "pytest", "-q"])
 
     out_parts: List[str] = []
     for cmd in checks:
         try:
-            r = subprocess.run(cmd, cwd=cwd, check=True, text=True, capture_output=True)
+            r = subprocess.run(cmd, cwd=cwd, env=environ, check=True, text=True, capture_output=True)
             out_parts.append(r.stdout)
         except subprocess.CalledProcessError as e:  # deterministic failure path
             out_parts.append(e.stdout or "")